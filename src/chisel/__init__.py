@@ -8,6 +8,12 @@ __version__ = "1.0.0"
 __author__ = "Chisel Development Team"
 __email__ = "dev@chisel.ai"
 
-from .app import ChiselApp
+__all__ = ["ChiselApp"]
 
-__all__ = ["ChiselApp"]
\ No newline at end of file
+
+def __getattr__(name: str) -> type:
+    """Import ChiselApp on first access so reading metadata skips PyQt6."""
+    if name == "ChiselApp":
+        from .app import ChiselApp
+        return ChiselApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
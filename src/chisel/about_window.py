@@ -10,47 +10,103 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QUrl
 from PyQt6.QtGui import QPixmap, QFont, QDesktopServices
 from pathlib import Path
+from typing import Optional
 from loguru import logger
-from .styles import apply_main_stylesheet
+
+_ICON_PATH = Path("resources/icons/chisel_tray.png")
 
 
 class AboutWindow(QDialog):
     """About window for the Chisel application."""
 
+    # Scaled header icon, shared by every instance after the first decode
+    _cached_icon: Optional[QPixmap] = None
+    # Set once the icon file is known to be missing, to skip further stat calls
+    _icon_missing = False
+
+    # Fonts are built once per process by _init_fonts() and shared by all
+    # instances (QFont is implicitly shared, so reuse across widgets is cheap)
+    _fonts_ready = False
+    TITLE_FONT: QFont
+    VERSION_FONT: QFont
+    TAGLINE_FONT: QFont
+    DESCRIPTION_FONT: QFont
+    AUTHOR_FONT: QFont
+    COPYRIGHT_FONT: QFont
+
     def __init__(self, parent=None):
+        # NOTE: construct lazily on first show; building this dialog decodes
+        # the icon and runs a layout pass. Styling comes from the application
+        # stylesheet set once in ChiselApp.
         super().__init__(parent)
 
         self.setWindowTitle("About Chisel")
         self.setModal(True)
         self.setFixedSize(380, 320)
         self.setObjectName("AboutWindow")
-        
-        # Apply external stylesheet
-        apply_main_stylesheet(self)
 
         self.setup_ui()
 
         logger.info("About window initialized")
 
+    @classmethod
+    def _init_fonts(cls) -> None:
+        """Create the window fonts on first use."""
+        if cls._fonts_ready:
+            return
+
+        cls.TITLE_FONT = QFont()
+        cls.TITLE_FONT.setPointSize(24)
+        cls.TITLE_FONT.setBold(True)
+        cls.TITLE_FONT.setFamily("Segoe UI")
+
+        cls.VERSION_FONT = QFont()
+        cls.VERSION_FONT.setPointSize(11)
+
+        cls.TAGLINE_FONT = QFont()
+        cls.TAGLINE_FONT.setPointSize(10)
+
+        cls.DESCRIPTION_FONT = QFont()
+        cls.DESCRIPTION_FONT.setPointSize(10)
+
+        cls.AUTHOR_FONT = QFont()
+        cls.AUTHOR_FONT.setPointSize(10)
+        cls.AUTHOR_FONT.setBold(True)
+
+        cls.COPYRIGHT_FONT = QFont()
+        cls.COPYRIGHT_FONT.setPointSize(9)
+
+        cls._fonts_ready = True
+
     def setup_ui(self) -> None:
         """Set up the user interface."""
+        type(self)._init_fonts()
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(25, 25, 25, 25)
         layout.setSpacing(15)
 
-        # --- Header ---
+        self._build_header(layout)
+        self._build_body(layout)
+        self._build_footer(layout)
+
+    def _build_header(self, layout: QVBoxLayout) -> None:
+        """Build the icon, title, version and tagline row."""
         header_layout = QHBoxLayout()
         header_layout.setSpacing(15)
 
         # Icon
         icon_label = QLabel()
         icon_label.setObjectName("iconLabel")
-        icon_path = Path("resources/icons/chisel_tray.png")
-        if icon_path.exists():
-            pixmap = QPixmap(str(icon_path)).scaled(
-                72, 72, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
-            icon_label.setPixmap(pixmap)
+        if AboutWindow._cached_icon is None and not AboutWindow._icon_missing:
+            if _ICON_PATH.exists():
+                AboutWindow._cached_icon = QPixmap(str(_ICON_PATH)).scaled(
+                    72, 72, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+                )
+            else:
+                AboutWindow._icon_missing = True
+        if AboutWindow._cached_icon is not None:
+            icon_label.setPixmap(AboutWindow._cached_icon)
         header_layout.addWidget(icon_label)
 
         # Title section
@@ -59,23 +115,15 @@ class AboutWindow(QDialog):
 
         title_label = QLabel("Chisel")
         title_label.setObjectName("titleLabel")
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title_font.setFamily("Segoe UI")
-        title_label.setFont(title_font)
+        title_label.setFont(self.TITLE_FONT)
 
         version_label = QLabel("v1.0.0")
         version_label.setObjectName("versionLabel")
-        version_font = QFont()
-        version_font.setPointSize(11)
-        version_label.setFont(version_font)
+        version_label.setFont(self.VERSION_FONT)
 
         tagline_label = QLabel("AI-Powered Text Rephrasing")
         tagline_label.setObjectName("taglineLabel")
-        tagline_font = QFont()
-        tagline_font.setPointSize(10)
-        tagline_label.setFont(tagline_font)
+        tagline_label.setFont(self.TAGLINE_FONT)
 
         title_layout.addWidget(title_label)
         title_layout.addWidget(version_label)
@@ -87,6 +135,8 @@ class AboutWindow(QDialog):
 
         layout.addLayout(header_layout)
 
+    def _build_body(self, layout: QVBoxLayout) -> None:
+        """Build the separator, description and author section."""
         # --- Separator ---
         separator = QFrame()
         separator.setObjectName("separator")
@@ -101,9 +151,7 @@ class AboutWindow(QDialog):
         )
         description_label.setObjectName("descriptionLabel")
         description_label.setWordWrap(True)
-        description_font = QFont()
-        description_font.setPointSize(10)
-        description_label.setFont(description_font)
+        description_label.setFont(self.DESCRIPTION_FONT)
         layout.addWidget(description_label)
 
         # --- Author Info ---
@@ -112,10 +160,7 @@ class AboutWindow(QDialog):
 
         author_label = QLabel("Created by Darko Kuzmanovic")
         author_label.setObjectName("authorLabel")
-        author_font = QFont()
-        author_font.setPointSize(10)
-        author_font.setBold(True)
-        author_label.setFont(author_font)
+        author_label.setFont(self.AUTHOR_FONT)
         author_layout.addWidget(author_label)
 
         # GitHub link
@@ -128,15 +173,15 @@ class AboutWindow(QDialog):
         layout.addLayout(author_layout)
         layout.addStretch()
 
+    def _build_footer(self, layout: QVBoxLayout) -> None:
+        """Build the copyright line and close button."""
         # --- Footer ---
         footer_layout = QHBoxLayout()
 
         # Copyright
         copyright_label = QLabel("© 2025 Darko Kuzmanovic")
         copyright_label.setObjectName("copyrightLabel")
-        copyright_font = QFont()
-        copyright_font.setPointSize(9)
-        copyright_label.setFont(copyright_font)
+        copyright_label.setFont(self.COPYRIGHT_FONT)
         footer_layout.addWidget(copyright_label)
 
         footer_layout.addStretch()
@@ -5,15 +5,22 @@ Handles API communication, error handling, and response processing.
 """
 
 import httpx
-import json
+import atexit
+import random
 import asyncio
-from typing import Optional, Dict, Any, List, Protocol
+import orjson
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Protocol, Tuple, AsyncIterator
 from dataclasses import dataclass
+from pathlib import Path
 from abc import ABC, abstractmethod
 from loguru import logger
 
+from .response_cache import ResponseCache, get_response_cache
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AIResponse:
     """Response from AI API."""
     success: bool
@@ -21,7 +28,7 @@ class AIResponse:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelInfo:
     """Information about a Gemini model."""
     name: str
@@ -33,43 +40,668 @@ class ModelInfo:
     supported_generation_methods: Optional[List[str]] = None
 
 
+# Static request fragments shared by every Gemini request
+_SAFETY_SETTINGS = tuple(
+    {"category": category, "threshold": "BLOCK_MEDIUM_AND_ABOVE"}
+    for category in (
+        "HARM_CATEGORY_HARASSMENT",
+        "HARM_CATEGORY_HATE_SPEECH",
+        "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        "HARM_CATEGORY_DANGEROUS_CONTENT",
+    )
+)
+
+# Separates the instruction from the selected text in every prompt
+_TEXT_LABEL = "\n\nText to process: "
+
+# Model name prefixes that get the concise-output system instruction
+_THINKING_MODEL_PREFIXES = ("gemini-2.5", "gemini-2.0")
+
+_SYSTEM_INSTRUCTION = {
+    "parts": [{
+        "text": "You are a text rephrasing assistant. Respond ONLY with the rephrased text, no thinking, no explanation, no additional commentary. Be direct and concise."
+    }]
+}
+
+
+def _parse_gemini_models(data: Dict[str, Any]) -> List[ModelInfo]:
+    """
+    Parse a Gemini models listing into ModelInfo entries.
+    
+    Only models that support generateContent are included.
+    
+    Args:
+        data: Decoded response from the models endpoint
+        
+    Returns:
+        List[ModelInfo]: Parsed models
+    """
+    models = []
+    for model_data in data.get("models", ()):
+        g = model_data.get
+        supported_methods = g("supportedGenerationMethods", ())
+        if "generateContent" in supported_methods:
+            models.append(ModelInfo(
+                name=g("name", "").removeprefix("models/"),
+                display_name=g("displayName", ""),
+                description=g("description", ""),
+                version=g("version", ""),
+                input_token_limit=g("inputTokenLimit"),
+                output_token_limit=g("outputTokenLimit"),
+                supported_generation_methods=supported_methods
+            ))
+    return models
+
+
+def _parse_openrouter_models(data: Dict[str, Any]) -> List[ModelInfo]:
+    """
+    Parse an OpenRouter models listing into ModelInfo entries.
+    
+    Args:
+        data: Decoded response from the models endpoint
+        
+    Returns:
+        List[ModelInfo]: Parsed models
+    """
+    models = []
+    for model_data in data.get("data", []):
+        models.append(ModelInfo(
+            name=model_data.get("id", ""),
+            display_name=model_data.get("name", model_data.get("id", "")),
+            description=model_data.get("description", ""),
+            input_token_limit=model_data.get("context_length"),
+            output_token_limit=model_data.get("top_provider", {}).get("max_completion_tokens"),
+        ))
+    return models
+
+
+_GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+_OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+def _openrouter_headers(api_key: str) -> Dict[str, str]:
+    """Auth and attribution headers for every OpenRouter request."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "HTTP-Referer": "https://github.com/chisel/chisel",  # Optional: for OpenRouter analytics
+        "X-Title": "Chisel Text Rephrasing Tool"  # Optional: for OpenRouter analytics
+    }
+
+
+def _provider_get_args(api_provider: str, api_key: str, path: str) -> Tuple[httpx.URL, Dict[str, str]]:
+    """URL and headers for an authenticated GET against a provider's API."""
+    if api_provider == "google":
+        # Gemini takes the API key as a query parameter
+        return httpx.URL(f"{_GEMINI_BASE_URL}/{path}", params={"key": api_key}), {}
+    elif api_provider == "openrouter":
+        return httpx.URL(f"{_OPENROUTER_BASE_URL}/{path}"), _openrouter_headers(api_key)
+    raise ValueError(f"Unsupported API provider: {api_provider}")
+
+
+# Models offered when a provider's models endpoint cannot be reached, keyed by
+# provider name. Kept in a data file so the list can be updated without code
+# changes, and read once at import
+_FALLBACK_MODELS_FILE = Path(__file__).parent / "resources" / "fallback_models.json"
+
+
+def _load_fallback_models() -> Dict[str, Tuple[ModelInfo, ...]]:
+    """Read the bundled fallback model lists; empty if the file is unusable."""
+    try:
+        data = orjson.loads(_FALLBACK_MODELS_FILE.read_bytes())
+        return {provider: tuple(ModelInfo(**model) for model in models) for provider, models in data.items()}
+    except (OSError, orjson.JSONDecodeError, TypeError) as e:
+        logger.error(f"Failed to load fallback models from {_FALLBACK_MODELS_FILE}: {e}")
+        return {}
+
+
+_FALLBACK_MODELS = _load_fallback_models()
+
+
+def get_fallback_models(provider: str) -> List[ModelInfo]:
+    """
+    Get the built-in model list for a provider.
+
+    Args:
+        provider: API provider name ("google" or "openrouter")
+
+    Returns:
+        List[ModelInfo]: Fallback models, empty for unknown providers
+    """
+    return list(_FALLBACK_MODELS.get(provider, ()))
+
+
+def _new_async_client(timeout: float, headers: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
+    """Create an HTTP/2 client with a keep-alive connection pool."""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=True,
+        headers=headers,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30)
+    )
+
+
+# Responses worth retrying: rate limiting and transient server errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_DELAY = 30.0  # seconds
+
+# Error bodies can be whole HTML pages; only this much goes into messages
+_ERROR_BODY_LIMIT = 2048
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for a zero-based retry attempt."""
+    return min(2 ** attempt, _MAX_RETRY_DELAY) + random.uniform(0, 1)
+
+
+def _error_message(response: httpx.Response) -> str:
+    """Describe an error response from its status and truncated body."""
+    body = response.content[:_ERROR_BODY_LIMIT].decode("utf-8", "replace")
+    return f"API error: {response.status_code} - {body}"
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), _MAX_RETRY_DELAY)
+
+
+# Process-wide client for calls that have no client instance, such as
+# fetch_models_static(); tied to the event loop it was created on
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Shared clients replaced while their loop was not running; closed at exit
+# if that loop can still run them
+_stale_shared_clients: List[Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = []
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide pooled HTTP client for the running event loop.
+    
+    Callers should await shutdown_shared_client() before the application
+    exits; an atexit hook closes it as a fallback.
+    
+    Returns:
+        httpx.AsyncClient: Shared HTTP/2 client
+    """
+    global _shared_client, _shared_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client_loop is not loop:
+        if _shared_client is not None:
+            _retire_shared_client(_shared_client, _shared_client_loop)
+        _shared_client = _new_async_client(30)
+        _shared_client_loop = loop
+    return _shared_client
+
+
+def _retire_shared_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Close a shared client that belongs to another event loop.
+    
+    Its connections can only be closed on its own loop: right away if that
+    loop is running in another thread, otherwise at exit.
+    
+    Args:
+        client: The replaced shared client
+        loop: The event loop it was created on
+    """
+    if loop.is_closed():
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        _stale_shared_clients.append((client, loop))
+
+
+async def shutdown_shared_client() -> None:
+    """Close the process-wide HTTP client."""
+    global _shared_client, _shared_client_loop
+    
+    client, _shared_client, _shared_client_loop = _shared_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+@atexit.register
+def _close_shared_client_at_exit() -> None:
+    """Close the shared clients whose event loops can still run them."""
+    global _shared_client, _shared_client_loop
+    
+    clients = list(_stale_shared_clients)
+    _stale_shared_clients.clear()
+    if _shared_client is not None and _shared_client_loop is not None:
+        clients.append((_shared_client, _shared_client_loop))
+    _shared_client, _shared_client_loop = None, None
+    
+    for client, loop in clients:
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(client.aclose())
+        except Exception as e:
+            logger.debug("Could not close shared HTTP client at exit: {}", e)
+
+
+async def fetch_provider_models(api_provider: str, api_key: str, timeout: int = 10,
+                                client: Optional[httpx.AsyncClient] = None) -> List[ModelInfo]:
+    """
+    Fetch a provider's model list without building an AIClient.
+    
+    Args:
+        api_provider: Provider name ("google" or "openrouter")
+        api_key: API key for the provider
+        timeout: Request timeout in seconds
+        client: HTTP client to send the request with; defaults to the
+            process-wide shared client
+        
+    Returns:
+        List[ModelInfo]: Available models, or the built-in list on failure
+    """
+    parse = _parse_gemini_models if api_provider == "google" else _parse_openrouter_models
+    try:
+        url, headers = _provider_get_args(api_provider, api_key, "models")
+        response = await (client or get_shared_client()).get(url, headers=headers, timeout=timeout)
+        
+        response.raise_for_status()
+        models = parse(orjson.loads(response.content))
+        
+        logger.info(f"Fetched {len(models)} {api_provider} models")
+        return models
+        
+    except Exception as e:
+        logger.error(f"Error fetching {api_provider} models: {e}")
+        logger.info(f"Using {api_provider} fallback model list")
+        return get_fallback_models(api_provider)
+
+
+async def test_provider_key(api_provider: str, api_key: str, timeout: int = 10,
+                            client: Optional[httpx.AsyncClient] = None) -> bool:
+    """
+    Check that a provider accepts an API key, without building an AIClient.
+    
+    Args:
+        api_provider: Provider name ("google" or "openrouter")
+        api_key: API key for the provider
+        timeout: Request timeout in seconds
+        client: HTTP client to send the request with; defaults to the
+            process-wide shared client
+        
+    Returns:
+        bool: True if the provider accepted the key
+    """
+    # Listing Gemini models needs a valid key; OpenRouter's /models is
+    # public, so look the key itself up there
+    path = "auth/key" if api_provider == "openrouter" else "models"
+    try:
+        url, headers = _provider_get_args(api_provider, api_key, path)
+        response = await (client or get_shared_client()).get(url, headers=headers, timeout=timeout)
+        success = response.status_code == 200
+        
+        if success:
+            logger.info(f"{api_provider} connection test successful")
+        else:
+            logger.warning(f"{api_provider} connection test failed: HTTP {response.status_code}")
+            
+        return success
+        
+    except Exception as e:
+        logger.error(f"{api_provider} connection test error: {e}")
+        return False
+
+
 class AIClient(ABC):
     """Abstract base class for AI API clients."""
     
+    model: str
+    timeout: int
+    
+    def __init__(self, max_retries: int = 2, response_cache: Optional[ResponseCache] = None) -> None:
+        self.max_retries = max_retries
+        self._response_cache = response_cache or get_response_cache()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def __aenter__(self) -> "AIClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every request made through the pooled client."""
+        return {}
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client, creating it on first use.
+        
+        The client is rebuilt when called from a different event loop, since
+        pooled connections cannot be shared between loops.
+        
+        Returns:
+            httpx.AsyncClient: HTTP/2 client with keep-alive connections
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = _new_async_client(self.timeout, self._default_headers())
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
+    async def _post_with_retries(self, url: Any, **kwargs: Any) -> httpx.Response:
+        """
+        POST through the pooled client, retrying transient failures.
+        
+        Timeouts, 429 and 5xx responses are retried up to max_retries times,
+        waiting for Retry-After when given or exponential backoff otherwise.
+        Other error statuses are returned immediately; callers check
+        response.is_error.
+        
+        Args:
+            url: Request URL
+            **kwargs: Extra arguments for httpx.AsyncClient.post
+            
+        Returns:
+            httpx.Response: Final response, with its body already read
+            
+        Raises:
+            httpx.TimeoutException: When the final attempt times out
+        """
+        client = await self._get_client()
+        
+        attempt = 0
+        while True:
+            try:
+                response = await client.post(url, **kwargs)
+            except httpx.TimeoutException:
+                if attempt >= self.max_retries:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"API request timed out, retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in _RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                delay = _retry_after(response)
+                if delay is None:
+                    delay = _backoff_delay(attempt)
+                logger.warning(f"API returned {response.status_code}, retrying in {delay:.1f}s")
+            
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def _process_cached(self, text: str, prompt: str, temperature: float, top_p: float, use_cache: bool = True) -> Optional[str]:
+        """
+        Process text, answering repeated requests from the response cache.
+        
+        Identical requests that arrive while one is in flight wait for it
+        and reuse its result instead of making their own API call.
+        
+        Args:
+            text: Text to process
+            prompt: Processing prompt/instruction
+            temperature: Temperature for generation
+            top_p: Top-p for generation
+            use_cache: False to neither read nor store the response, for
+                text that must not be written to disk
+            
+        Returns:
+            Optional[str]: Processed text, or None if processing failed
+        """
+        if not use_cache:
+            return await self._process_uncached(text, prompt, temperature, top_p)
+        
+        cache = self._response_cache
+        cache_key = cache.make_key(self.model, prompt, text, temperature, top_p)
+        
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached AI response")
+            return cached
+        
+        async with cache.lock(cache_key):
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached AI response")
+                return cached
+            
+            result = await self._process_uncached(text, prompt, temperature, top_p)
+            if result is not None:
+                cache.set(cache_key, result)
+            return result
+    
+    async def _process_uncached(self, text: str, prompt: str, temperature: float, top_p: float) -> Optional[str]:
+        """
+        Process text with one API call, bypassing the response cache.
+        
+        Args:
+            text: Text to process
+            prompt: Processing prompt/instruction
+            temperature: Temperature for generation
+            top_p: Top-p for generation
+            
+        Returns:
+            Optional[str]: Processed text, or None if processing failed
+        """
+        try:
+            # Prepare the request
+            request_data = self._build_request(text, prompt, temperature, top_p)
+            
+            # Make the API call
+            response = await self._make_api_call(request_data)
+            
+            if response.success:
+                return response.text
+            else:
+                logger.error(f"AI processing failed: {response.error}")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Unexpected error during AI processing: {e}")
+            return None
+    
+    async def process_text_stream(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8, use_cache: bool = True) -> AsyncIterator[str]:
+        """
+        Stream processed text as the provider generates it.
+        
+        process_text() stays buffered because the result replaces the
+        selection in one paste; this is for callers that can show partial
+        output. A cached response is yielded whole.
+        
+        Args:
+            text: Text to process
+            prompt: Processing prompt/instruction
+            temperature: Temperature for generation
+            top_p: Top-p for generation
+            use_cache: False to neither read nor store the response
+            
+        Yields:
+            str: Pieces of the processed text in order
+        """
+        if not text.strip():
+            logger.warning("Empty text provided for processing")
+            return
+        
+        cache = self._response_cache
+        cache_key = cache.make_key(self.model, prompt, text, temperature, top_p)
+        cached = cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.info("Using cached AI response")
+            yield cached
+            return
+        
+        url, request_data = self._build_stream_request(text, prompt, temperature, top_p)
+        client = await self._get_client()
+        pieces: List[str] = []
+        
+        try:
+            async with client.stream(
+                "POST",
+                url,
+                content=orjson.dumps(request_data),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    logger.error(_error_message(response))
+                    return
+                
+                # An SSE event may span several "data:" lines; collect them in
+                # a list and only parse once the event can be complete
+                event_lines: List[str] = []
+                
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        payload = line[5:].strip()
+                        if payload == "[DONE]":
+                            break
+                        event_lines.append(payload)
+                        if payload[-1:] not in ("}", "]"):
+                            continue
+                    elif line or not event_lines:
+                        # Comments and other fields, or an event already parsed
+                        continue
+                    
+                    try:
+                        event = orjson.loads("\n".join(event_lines))
+                    except orjson.JSONDecodeError:
+                        if line:
+                            # Only looked complete; wait for the rest of the event
+                            continue
+                        raise
+                    event_lines.clear()
+                    
+                    piece = self._extract_stream_text(event)
+                    if piece:
+                        pieces.append(piece)
+                        yield piece
+                        
+        except httpx.TimeoutException:
+            logger.error(f"API stream timed out after {self.timeout} seconds")
+            return
+        except orjson.JSONDecodeError:
+            logger.error("Invalid JSON event in API stream")
+            return
+        
+        result = "".join(pieces).strip()
+        if result and use_cache:
+            cache.set(cache_key, result)
+    
+    @abstractmethod
+    def _build_stream_request(self, text: str, prompt: str, temperature: float, top_p: float) -> Tuple[Any, Dict[str, Any]]:
+        """Build the URL and payload for a streamed request."""
+        pass
+    
+    @abstractmethod
+    def _extract_stream_text(self, event: Dict[str, Any]) -> Optional[str]:
+        """Extract the text delta from one streamed event."""
+        pass
+    
+    @abstractmethod
+    def _build_request(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8) -> Dict[str, Any]:
+        """Build the provider-specific request payload."""
+        pass
+    
+    @abstractmethod
+    async def _make_api_call(self, request_data: Dict[str, Any]) -> AIResponse:
+        """Send a request payload to the provider."""
+        pass
+    
     @abstractmethod
-    async def process_text(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8) -> Optional[str]:
-        """Process text with AI and return the result."""
+    async def process_text(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8, use_cache: bool = True) -> Optional[str]:
+        """Process text with AI and return the result; use_cache=False keeps it out of the response cache."""
         pass
     
     @abstractmethod
-    async def test_connection(self) -> bool:
-        """Test the API connection."""
+    async def test_connection(self, client: Optional[httpx.AsyncClient] = None) -> bool:
+        """Test the API connection, optionally through another HTTP client."""
         pass
     
     @abstractmethod
-    async def fetch_available_models(self) -> List[ModelInfo]:
-        """Fetch available models from the API."""
+    async def fetch_available_models(self, client: Optional[httpx.AsyncClient] = None) -> List[ModelInfo]:
+        """Fetch available models from the API, optionally through another HTTP client."""
         pass
+    
+    async def warm_up(self) -> Tuple[bool, List[ModelInfo]]:
+        """
+        Test the connection and fetch the model list concurrently.
+        
+        Returns:
+            Tuple[bool, List[ModelInfo]]: Connection test result and available models
+        """
+        connected, models = await asyncio.gather(
+            self.test_connection(),
+            self.fetch_available_models()
+        )
+        return connected, models
 
 
 class GeminiClient(AIClient):
     """Google Gemini API client for text processing."""
     
-    def __init__(self, api_key: str, timeout: int = 30, model: str = "gemini-1.5-pro-latest"):
+    def __init__(self, api_key: str, timeout: int = 30, model: str = "gemini-1.5-pro-latest", max_retries: int = 2):
+        super().__init__(max_retries)
         self.api_key = api_key
         self.timeout = timeout
-        self.base_url = "https://generativelanguage.googleapis.com/v1beta"
+        self.base_url = _GEMINI_BASE_URL
+        
+        # The model setter derives the request template and the model-specific
+        # URLs, which carry the API key as a query param
         self.model = model
         
         logger.info(f"Gemini AI client initialized with model: {model}")
     
-    async def process_text(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8) -> Optional[str]:
+    @property
+    def model(self) -> str:
+        return self._model
+    
+    @model.setter
+    def model(self, model: str) -> None:
+        """Set the model and rebuild everything derived from it."""
+        self._model = model
+        
+        self._generate_url = httpx.URL(
+            f"{self.base_url}/models/{model}:generateContent", params={"key": self.api_key}
+        )
+        self._stream_url = httpx.URL(
+            f"{self.base_url}/models/{model}:streamGenerateContent", params={"key": self.api_key, "alt": "sse"}
+        )
+        
+        # For thinking models like Gemini 2.5, add system instruction to be concise
+        self._is_thinking_model = model.startswith(_THINKING_MODEL_PREFIXES)
+        self._system_instruction = _SYSTEM_INSTRUCTION if self._is_thinking_model else None
+        
+        # Request fields that never change for this model; _build_request
+        # copies this and fills in the per-call contents and config
+        self._request_template: Dict[str, Any] = {"safetySettings": _SAFETY_SETTINGS}
+        if self._is_thinking_model:
+            self._request_template["systemInstruction"] = self._system_instruction
+    
+    async def process_text(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8, use_cache: bool = True) -> Optional[str]:
         """
         Send text to Gemini API for processing.
         
         Args:
             text: Text to process
             prompt: Processing prompt/instruction
+            use_cache: False to neither read nor store the response
             
         Returns:
             Optional[str]: Processed text, or None if processing failed
@@ -78,22 +710,7 @@ class GeminiClient(AIClient):
             logger.warning("Empty text provided for processing")
             return None
         
-        try:
-            # Prepare the request
-            request_data = self._build_request(text, prompt, temperature, top_p)
-            
-            # Make the API call
-            response = await self._make_api_call(request_data)
-            
-            if response.success:
-                return response.text
-            else:
-                logger.error(f"AI processing failed: {response.error}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Unexpected error during AI processing: {e}")
-            return None
+        return await self._process_cached(text, prompt, temperature, top_p, use_cache)
     
     def _build_request(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8) -> Dict[str, Any]:
         """
@@ -106,53 +723,36 @@ class GeminiClient(AIClient):
         Returns:
             Dict[str, Any]: Request payload
         """
-        # For thinking models like Gemini 2.5, add system instruction to be concise
-        system_instruction = None
-        if "2.5" in self.model or "2.0" in self.model:
-            system_instruction = {
-                "parts": [{
-                    "text": "You are a text rephrasing assistant. Respond ONLY with the rephrased text, no thinking, no explanation, no additional commentary. Be direct and concise."
-                }]
-            }
-        
-        request = {
-            "contents": [{
-                "parts": [{
-                    "text": f"{prompt}\\n\\nText to process: {text}"
-                }]
-            }],
-            "generationConfig": {
-                "temperature": temperature,
-                "maxOutputTokens": 8192,  # Increased for thinking models
-                "topP": top_p,
-                "topK": 40
-            },
-            "safetySettings": [
-                {
-                    "category": "HARM_CATEGORY_HARASSMENT",
-                    "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                },
-                {
-                    "category": "HARM_CATEGORY_HATE_SPEECH", 
-                    "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                },
-                {
-                    "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                    "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                },
-                {
-                    "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                    "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                }
+        request = self._request_template.copy()
+        request["contents"] = [{
+            # Sent as separate parts so the selected text is not copied
+            # into a new combined string; Gemini joins them server-side
+            "parts": [
+                {"text": prompt},
+                {"text": _TEXT_LABEL},
+                {"text": text}
             ]
+        }]
+        request["generationConfig"] = {
+            "temperature": temperature,
+            "maxOutputTokens": 8192,  # Increased for thinking models
+            "topP": top_p,
+            "topK": 40
         }
-        
-        # Add system instruction if available
-        if system_instruction:
-            request["systemInstruction"] = system_instruction
-            
         return request
     
+    def _build_stream_request(self, text: str, prompt: str, temperature: float, top_p: float) -> Tuple[Any, Dict[str, Any]]:
+        """Build the SSE endpoint and payload for a streamed request."""
+        return self._stream_url, self._build_request(text, prompt, temperature, top_p)
+    
+    def _extract_stream_text(self, event: Dict[str, Any]) -> Optional[str]:
+        """Join the text parts of one streamed Gemini event."""
+        try:
+            parts = event["candidates"][0]["content"]["parts"]
+        except (KeyError, IndexError, TypeError):
+            return None
+        return "".join(part.get("text", "") for part in parts)
+    
     async def _make_api_call(self, request_data: Dict[str, Any]) -> AIResponse:
         """
         Make the actual API call to Gemini.
@@ -163,53 +763,51 @@ class GeminiClient(AIClient):
         Returns:
             AIResponse: API response
         """
-        url = f"{self.base_url}/models/{self.model}:generateContent"
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                logger.debug("Making API call to Gemini")
-                
-                response = await client.post(
-                    url,
-                    params={"key": self.api_key},
-                    json=request_data,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Log the full response for debugging
-                logger.debug(f"Full API response: {json.dumps(data, indent=2)}")
-                
-                # Extract response text
-                processed_text = self._extract_response_text(data)
-                
-                if processed_text:
-                    logger.info("AI processing completed successfully")
-                    return AIResponse(success=True, text=processed_text)
-                else:
-                    return AIResponse(success=False, error="No valid response from AI")
-                
-            except httpx.TimeoutException:
-                error_msg = f"API request timed out after {self.timeout} seconds"
-                logger.error(error_msg)
-                return AIResponse(success=False, error=error_msg)
-                
-            except httpx.HTTPStatusError as e:
-                error_msg = f"API error: {e.response.status_code} - {e.response.text}"
-                logger.error(error_msg)
-                return AIResponse(success=False, error=error_msg)
-                
-            except json.JSONDecodeError:
-                error_msg = "Invalid JSON response from API"
-                logger.error(error_msg)
-                return AIResponse(success=False, error=error_msg)
-                
-            except Exception as e:
-                error_msg = f"Unexpected API error: {str(e)}"
+        try:
+            logger.debug("Making API call to Gemini")
+            
+            response = await self._post_with_retries(
+                self._generate_url,
+                content=orjson.dumps(request_data),
+                headers={"Content-Type": "application/json"}
+            )
+            
+            if response.is_error:
+                error_msg = _error_message(response)
                 logger.error(error_msg)
                 return AIResponse(success=False, error=error_msg)
+            
+            data = orjson.loads(response.content)
+            
+            # Log the full response for debugging (only rendered when DEBUG is enabled)
+            logger.opt(lazy=True).debug(
+                "Full API response: {}",
+                lambda: orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            )
+            
+            # Extract response text
+            processed_text = self._extract_response_text(data)
+            
+            if processed_text:
+                logger.info("AI processing completed successfully")
+                return AIResponse(success=True, text=processed_text)
+            else:
+                return AIResponse(success=False, error="No valid response from AI")
+            
+        except httpx.TimeoutException:
+            error_msg = f"API request timed out after {self.timeout} seconds"
+            logger.error(error_msg)
+            return AIResponse(success=False, error=error_msg)
+            
+        except orjson.JSONDecodeError:
+            error_msg = "Invalid JSON response from API"
+            logger.error(error_msg)
+            return AIResponse(success=False, error=error_msg)
+            
+        except Exception as e:
+            error_msg = f"Unexpected API error: {str(e)}"
+            logger.error(error_msg)
+            return AIResponse(success=False, error=error_msg)
     
     def _extract_response_text(self, data: Dict[str, Any]) -> Optional[str]:
         """
@@ -221,23 +819,38 @@ class GeminiClient(AIClient):
         Returns:
             Optional[str]: Extracted text or None
         """
+        # Fast path for the usual well-formed response; anything unexpected
+        # falls through to the diagnostic walk below
+        try:
+            candidate = data["candidates"][0]
+            text = candidate["content"]["parts"][0]["text"].strip()
+        except (KeyError, IndexError, TypeError, AttributeError):
+            text = None
+        
+        if text:
+            finish_reason = candidate.get("finishReason")
+            if finish_reason not in ("SAFETY", "RECITATION"):
+                if finish_reason == "MAX_TOKENS":
+                    logger.warning("Response was truncated due to token limit")
+                return text
+        
         try:
             # Log the structure we're working with
-            logger.debug(f"Extracting text from response structure: {list(data.keys())}")
+            logger.opt(lazy=True).debug("Extracting text from response structure: {}", lambda: list(data.keys()))
             
             candidates = data.get("candidates", [])
             if not candidates:
                 logger.warning("No candidates in API response")
-                logger.debug(f"Available top-level keys: {list(data.keys())}")
+                logger.opt(lazy=True).debug("Available top-level keys: {}", lambda: list(data.keys()))
                 return None
             
             candidate = candidates[0]
-            logger.debug(f"First candidate keys: {list(candidate.keys())}")
+            logger.opt(lazy=True).debug("First candidate keys: {}", lambda: list(candidate.keys()))
             
             # Check finish reason for issues
             finish_reason = candidate.get("finishReason")
             if finish_reason:
-                logger.debug(f"Finish reason: {finish_reason}")
+                logger.debug("Finish reason: {}", finish_reason)
                 if finish_reason == "MAX_TOKENS":
                     logger.warning("Response was truncated due to token limit")
                 elif finish_reason in ["SAFETY", "RECITATION"]:
@@ -248,15 +861,15 @@ class GeminiClient(AIClient):
             content = candidate.get("content", {})
             if not content:
                 logger.warning("No content in candidate")
-                logger.debug(f"Candidate structure: {candidate}")
+                logger.debug("Candidate structure: {}", candidate)
                 return None
             
-            logger.debug(f"Content keys: {list(content.keys())}")
+            logger.opt(lazy=True).debug("Content keys: {}", lambda: list(content.keys()))
             parts = content.get("parts", [])
             
             if not parts:
                 logger.warning("No parts in API response content")
-                logger.debug(f"Content structure: {content}")
+                logger.debug("Content structure: {}", content)
                 
                 # Try alternative structure for thinking models
                 if "role" in content and "parts" not in content:
@@ -271,7 +884,7 @@ class GeminiClient(AIClient):
             
             # Extract text from parts
             for i, part in enumerate(parts):
-                logger.debug(f"Part {i} keys: {list(part.keys())}")
+                logger.opt(lazy=True).debug("Part {} keys: {}", lambda: i, lambda: list(part.keys()))
                 text = part.get("text", "").strip()
                 if text:
                     logger.info(f"Found text in part {i}")
@@ -282,73 +895,37 @@ class GeminiClient(AIClient):
             
         except (KeyError, IndexError, AttributeError) as e:
             logger.error(f"Error extracting response text: {e}")
-            logger.debug(f"Full error context - data keys: {list(data.keys()) if isinstance(data, dict) else 'not dict'}")
+            logger.opt(lazy=True).debug(
+                "Full error context - data keys: {}",
+                lambda: list(data.keys()) if isinstance(data, dict) else 'not dict'
+            )
             return None
     
-    async def test_connection(self) -> bool:
+    async def test_connection(self, client: Optional[httpx.AsyncClient] = None) -> bool:
         """
-        Test the API connection with a simple request.
+        Test the API connection by listing models with the configured key.
+        
+        Args:
+            client: HTTP client to send the request with; defaults to this
+                instance's own pool
         
         Returns:
             bool: True if connection is working
         """
-        test_text = "Hello"
-        test_prompt = "Simply return the word 'Success' if you can process this."
-        
-        try:
-            result = await self.process_text(test_text, test_prompt)
-            success = result is not None and "success" in result.lower()
-            
-            if success:
-                logger.info("AI client connection test successful")
-            else:
-                logger.warning("AI client connection test failed")
-                
-            return success
-            
-        except Exception as e:
-            logger.error(f"AI client connection test error: {e}")
-            return False
+        return await test_provider_key("google", self.api_key, self.timeout, client or await self._get_client())
     
-    async def fetch_available_models(self) -> List[ModelInfo]:
+    async def fetch_available_models(self, client: Optional[httpx.AsyncClient] = None) -> List[ModelInfo]:
         """
         Fetch available models from Google AI API.
         
+        Args:
+            client: HTTP client to send the request with, such as
+                get_shared_client(); defaults to this instance's own pool
+        
         Returns:
             List[ModelInfo]: List of available models
         """
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    params={"key": self.api_key}
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                models = []
-                for model_data in data.get("models", []):
-                    # Only include models that support generateContent
-                    supported_methods = model_data.get("supportedGenerationMethods", [])
-                    if "generateContent" in supported_methods:
-                        model_info = ModelInfo(
-                            name=model_data.get("name", "").replace("models/", ""),
-                            display_name=model_data.get("displayName", ""),
-                            description=model_data.get("description", ""),
-                            version=model_data.get("version", ""),
-                            input_token_limit=model_data.get("inputTokenLimit"),
-                            output_token_limit=model_data.get("outputTokenLimit"),
-                            supported_generation_methods=supported_methods
-                        )
-                        models.append(model_info)
-                
-                logger.info(f"Fetched {len(models)} available models")
-                return models
-                
-        except Exception as e:
-            logger.error(f"Error fetching models: {e}")
-            return self._get_fallback_models()
+        return await fetch_provider_models("google", self.api_key, self.timeout, client or await self._get_client())
     
     def _get_fallback_models(self) -> List[ModelInfo]:
         """
@@ -363,110 +940,47 @@ class GeminiClient(AIClient):
         return fallback_models
     
     @staticmethod
-    async def fetch_models_static(api_key: str, timeout: int = 10) -> List[ModelInfo]:
+    async def fetch_models_static(api_key: str, timeout: int = 10, client: Optional[httpx.AsyncClient] = None) -> List[ModelInfo]:
         """
         Static method to fetch models without creating a client instance.
         
         Args:
             api_key: Google AI API key
             timeout: Request timeout in seconds
+            client: HTTP client to send the request with; defaults to the
+                process-wide shared client
             
         Returns:
             List[ModelInfo]: Available models
         """
         if not api_key:
             return GeminiClient._get_fallback_models_static()
-            
-        try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(
-                    "https://generativelanguage.googleapis.com/v1beta/models",
-                    params={"key": api_key}
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                models = []
-                for model_data in data.get("models", []):
-                    supported_methods = model_data.get("supportedGenerationMethods", [])
-                    if "generateContent" in supported_methods:
-                        model_info = ModelInfo(
-                            name=model_data.get("name", "").replace("models/", ""),
-                            display_name=model_data.get("displayName", ""),
-                            description=model_data.get("description", ""),
-                            version=model_data.get("version", ""),
-                            input_token_limit=model_data.get("inputTokenLimit"),
-                            output_token_limit=model_data.get("outputTokenLimit"),
-                            supported_generation_methods=supported_methods
-                        )
-                        models.append(model_info)
-                
-                return models
-                
-        except Exception as e:
-            logger.error(f"Error fetching models (static): {e}")
-            return GeminiClient._get_fallback_models_static()
+        
+        return await fetch_provider_models("google", api_key, timeout, client)
     
     @staticmethod
     def _get_fallback_models_static() -> List[ModelInfo]:
         """Static fallback models - updated with latest 2.5 models."""
-        return [
-            ModelInfo(
-                name="gemini-2.5-pro",
-                display_name="Gemini 2.5 Pro",
-                description="Latest Gemini 2.5 Pro with advanced reasoning"
-            ),
-            ModelInfo(
-                name="gemini-2.5-flash",
-                display_name="Gemini 2.5 Flash",
-                description="Fast and efficient Gemini 2.5 model"
-            ),
-            ModelInfo(
-                name="gemini-2.0-flash-exp",
-                display_name="Gemini 2.0 Flash (Experimental)",
-                description="Latest experimental Gemini 2.0 model"
-            ),
-            ModelInfo(
-                name="gemini-1.5-pro-latest", 
-                display_name="Gemini 1.5 Pro (Latest)",
-                description="Latest Gemini 1.5 Pro model"
-            ),
-            ModelInfo(
-                name="gemini-1.5-pro",
-                display_name="Gemini 1.5 Pro",
-                description="Stable Gemini 1.5 Pro model"
-            ),
-            ModelInfo(
-                name="gemini-1.5-flash-latest",
-                display_name="Gemini 1.5 Flash (Latest)",
-                description="Latest fast Gemini 1.5 model"
-            ),
-            ModelInfo(
-                name="gemini-1.5-flash",
-                display_name="Gemini 1.5 Flash",
-                description="Fast and efficient Gemini model"
-            ),
-            ModelInfo(
-                name="gemini-pro",
-                display_name="Gemini Pro",
-                description="Standard Gemini Pro model"
-            )
-        ]
+        return get_fallback_models("google")
 
 
 class OpenRouterClient(AIClient):
     """OpenRouter API client for text processing using OpenAI-compatible format."""
     
-    def __init__(self, api_key: str, timeout: int = 30, model: str = "openai/gpt-oss-20b:free"):
+    def __init__(self, api_key: str, timeout: int = 30, model: str = "openai/gpt-oss-20b:free", max_retries: int = 2):
+        super().__init__(max_retries)
         self.api_key = api_key
         self.timeout = timeout
         self.model = model
-        self.base_url = "https://openrouter.ai/api/v1"
+        self.base_url = _OPENROUTER_BASE_URL
         
         logger.info(f"OpenRouter AI client initialized with model: {model}")
     
-    async def process_text(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8) -> Optional[str]:
+    def _default_headers(self) -> Dict[str, str]:
+        """Auth and attribution headers for every OpenRouter request."""
+        return _openrouter_headers(self.api_key)
+    
+    async def process_text(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8, use_cache: bool = True) -> Optional[str]:
         """
         Send text to OpenRouter API for processing.
         
@@ -475,6 +989,7 @@ class OpenRouterClient(AIClient):
             prompt: Processing prompt/instruction
             temperature: Temperature for generation
             top_p: Top-p for generation
+            use_cache: False to neither read nor store the response
             
         Returns:
             Optional[str]: Processed text, or None if processing failed
@@ -483,22 +998,7 @@ class OpenRouterClient(AIClient):
             logger.warning("Empty text provided for processing")
             return None
         
-        try:
-            # Prepare the request
-            request_data = self._build_request(text, prompt, temperature, top_p)
-            
-            # Make the API call
-            response = await self._make_api_call(request_data)
-            
-            if response.success:
-                return response.text
-            else:
-                logger.error(f"AI processing failed: {response.error}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Unexpected error during AI processing: {e}")
-            return None
+        return await self._process_cached(text, prompt, temperature, top_p, use_cache)
     
     def _build_request(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8) -> Dict[str, Any]:
         """
@@ -514,7 +1014,7 @@ class OpenRouterClient(AIClient):
             Dict[str, Any]: Request payload
         """
         # Combine prompt and text for OpenRouter
-        full_prompt = f"{prompt}\n\nText to process: {text}"
+        full_prompt = "".join((prompt, _TEXT_LABEL, text))
         
         return {
             "model": self.model,
@@ -530,6 +1030,19 @@ class OpenRouterClient(AIClient):
             "stream": False
         }
     
+    def _build_stream_request(self, text: str, prompt: str, temperature: float, top_p: float) -> Tuple[Any, Dict[str, Any]]:
+        """Build the endpoint and payload for a streamed request."""
+        request_data = self._build_request(text, prompt, temperature, top_p)
+        request_data["stream"] = True
+        return f"{self.base_url}/chat/completions", request_data
+    
+    def _extract_stream_text(self, event: Dict[str, Any]) -> Optional[str]:
+        """Extract the content delta from one streamed OpenRouter event."""
+        try:
+            return event["choices"][0]["delta"].get("content")
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return None
+    
     async def _make_api_call(self, request_data: Dict[str, Any]) -> AIResponse:
         """
         Make the actual API call to OpenRouter.
@@ -541,58 +1054,51 @@ class OpenRouterClient(AIClient):
             AIResponse: API response
         """
         url = f"{self.base_url}/chat/completions"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/chisel/chisel",  # Optional: for OpenRouter analytics
-            "X-Title": "Chisel Text Rephrasing Tool"  # Optional: for OpenRouter analytics
-        }
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                logger.debug("Making API call to OpenRouter")
-                
-                response = await client.post(
-                    url,
-                    json=request_data,
-                    headers=headers
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Log the full response for debugging
-                logger.debug(f"Full API response: {json.dumps(data, indent=2)}")
-                
-                # Extract response text
-                processed_text = self._extract_response_text(data)
-                
-                if processed_text:
-                    logger.info("AI processing completed successfully")
-                    return AIResponse(success=True, text=processed_text)
-                else:
-                    return AIResponse(success=False, error="No valid response from AI")
-                
-            except httpx.TimeoutException:
-                error_msg = f"API request timed out after {self.timeout} seconds"
-                logger.error(error_msg)
-                return AIResponse(success=False, error=error_msg)
-                
-            except httpx.HTTPStatusError as e:
-                error_msg = f"API error: {e.response.status_code} - {e.response.text}"
-                logger.error(error_msg)
-                return AIResponse(success=False, error=error_msg)
-                
-            except json.JSONDecodeError:
-                error_msg = "Invalid JSON response from API"
-                logger.error(error_msg)
-                return AIResponse(success=False, error=error_msg)
-                
-            except Exception as e:
-                error_msg = f"Unexpected API error: {str(e)}"
+        try:
+            logger.debug("Making API call to OpenRouter")
+            
+            response = await self._post_with_retries(
+                url,
+                content=orjson.dumps(request_data),
+                headers={"Content-Type": "application/json"}
+            )
+            
+            if response.is_error:
+                error_msg = _error_message(response)
                 logger.error(error_msg)
                 return AIResponse(success=False, error=error_msg)
+            
+            data = orjson.loads(response.content)
+            
+            # Log the full response for debugging
+            logger.opt(lazy=True).debug(
+                "Full API response: {}",
+                lambda: orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            )
+            
+            # Extract response text
+            processed_text = self._extract_response_text(data)
+            
+            if processed_text:
+                logger.info("AI processing completed successfully")
+                return AIResponse(success=True, text=processed_text)
+            else:
+                return AIResponse(success=False, error="No valid response from AI")
+            
+        except httpx.TimeoutException:
+            error_msg = f"API request timed out after {self.timeout} seconds"
+            logger.error(error_msg)
+            return AIResponse(success=False, error=error_msg)
+            
+        except orjson.JSONDecodeError:
+            error_msg = "Invalid JSON response from API"
+            logger.error(error_msg)
+            return AIResponse(success=False, error=error_msg)
+            
+        except Exception as e:
+            error_msg = f"Unexpected API error: {str(e)}"
+            logger.error(error_msg)
+            return AIResponse(success=False, error=error_msg)
     
     def _extract_response_text(self, data: Dict[str, Any]) -> Optional[str]:
         """
@@ -604,26 +1110,38 @@ class OpenRouterClient(AIClient):
         Returns:
             Optional[str]: Extracted text or None
         """
+        # Fast path for the usual well-formed response; anything unexpected
+        # falls through to the diagnostic walk below
+        try:
+            text = data["choices"][0]["message"]["content"].strip()
+        except (KeyError, IndexError, TypeError, AttributeError):
+            text = None
+        
+        if text:
+            return text
+        
         try:
             # Log the structure we're working with
-            logger.debug(f"Extracting text from OpenRouter response structure: {list(data.keys())}")
+            logger.opt(lazy=True).debug(
+                "Extracting text from OpenRouter response structure: {}", lambda: list(data.keys())
+            )
             
             choices = data.get("choices", [])
             if not choices:
                 logger.warning("No choices in OpenRouter API response")
-                logger.debug(f"Available top-level keys: {list(data.keys())}")
+                logger.opt(lazy=True).debug("Available top-level keys: {}", lambda: list(data.keys()))
                 return None
             
             choice = choices[0]
-            logger.debug(f"First choice keys: {list(choice.keys())}")
+            logger.opt(lazy=True).debug("First choice keys: {}", lambda: list(choice.keys()))
             
             message = choice.get("message", {})
             if not message:
                 logger.warning("No message in choice")
-                logger.debug(f"Choice structure: {choice}")
+                logger.debug("Choice structure: {}", choice)
                 return None
             
-            logger.debug(f"Message keys: {list(message.keys())}")
+            logger.opt(lazy=True).debug("Message keys: {}", lambda: list(message.keys()))
             content = message.get("content", "").strip()
             
             if not content:
@@ -635,68 +1153,37 @@ class OpenRouterClient(AIClient):
             
         except (KeyError, IndexError, AttributeError) as e:
             logger.error(f"Error extracting response text: {e}")
-            logger.debug(f"Full error context - data keys: {list(data.keys()) if isinstance(data, dict) else 'not dict'}")
+            logger.opt(lazy=True).debug(
+                "Full error context - data keys: {}",
+                lambda: list(data.keys()) if isinstance(data, dict) else 'not dict'
+            )
             return None
     
-    async def test_connection(self) -> bool:
+    async def test_connection(self, client: Optional[httpx.AsyncClient] = None) -> bool:
         """
-        Test the API connection with a simple request.
+        Test the API connection by looking up the configured key.
+        
+        Args:
+            client: HTTP client to send the request with; defaults to this
+                instance's own pool
         
         Returns:
             bool: True if connection is working
         """
-        test_text = "Hello"
-        test_prompt = "Simply return the word 'Success' if you can process this."
-        
-        try:
-            result = await self.process_text(test_text, test_prompt)
-            success = result is not None and "success" in result.lower()
-            
-            if success:
-                logger.info("OpenRouter client connection test successful")
-            else:
-                logger.warning("OpenRouter client connection test failed")
-                
-            return success
-            
-        except Exception as e:
-            logger.error(f"OpenRouter client connection test error: {e}")
-            return False
+        return await test_provider_key("openrouter", self.api_key, self.timeout, client or await self._get_client())
     
-    async def fetch_available_models(self) -> List[ModelInfo]:
+    async def fetch_available_models(self, client: Optional[httpx.AsyncClient] = None) -> List[ModelInfo]:
         """
         Fetch available models from OpenRouter API.
         
+        Args:
+            client: HTTP client to send the request with, such as
+                get_shared_client(); defaults to this instance's own pool
+        
         Returns:
             List[ModelInfo]: List of available models
         """
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers={"Authorization": f"Bearer {self.api_key}"}
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                models = []
-                for model_data in data.get("data", []):
-                    model_info = ModelInfo(
-                        name=model_data.get("id", ""),
-                        display_name=model_data.get("name", model_data.get("id", "")),
-                        description=model_data.get("description", ""),
-                        input_token_limit=model_data.get("context_length"),
-                        output_token_limit=model_data.get("top_provider", {}).get("max_completion_tokens"),
-                    )
-                    models.append(model_info)
-                
-                logger.info(f"Fetched {len(models)} OpenRouter models")
-                return models
-                
-        except Exception as e:
-            logger.error(f"Error fetching OpenRouter models: {e}")
-            return self._get_fallback_models()
+        return await fetch_provider_models("openrouter", self.api_key, self.timeout, client or await self._get_client())
     
     def _get_fallback_models(self) -> List[ModelInfo]:
         """
@@ -705,33 +1192,7 @@ class OpenRouterClient(AIClient):
         Returns:
             List[ModelInfo]: Fallback models list
         """
-        fallback_models = [
-            ModelInfo(
-                name="openai/gpt-oss-20b:free",
-                display_name="GPT OSS 20B (Free)",
-                description="Free OpenRouter model with 1000 requests/day"
-            ),
-            ModelInfo(
-                name="openai/gpt-4o-mini",
-                display_name="GPT-4o Mini",
-                description="Faster and cheaper GPT-4 variant"
-            ),
-            ModelInfo(
-                name="anthropic/claude-3-haiku",
-                display_name="Claude 3 Haiku",
-                description="Fast and efficient Claude model"
-            ),
-            ModelInfo(
-                name="meta-llama/llama-3.1-8b-instruct:free",
-                display_name="Llama 3.1 8B (Free)",
-                description="Free Llama model"
-            ),
-            ModelInfo(
-                name="google/gemini-flash-1.5",
-                display_name="Gemini Flash 1.5",
-                description="Fast Google model via OpenRouter"
-            )
-        ]
+        fallback_models = get_fallback_models("openrouter")
         
         logger.info("Using OpenRouter fallback model list")
         return fallback_models
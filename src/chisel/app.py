@@ -7,39 +7,50 @@ and handles the application lifecycle.
 
 import sys
 import asyncio
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+import qasync
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import pyqtSignal
 from loguru import logger
 
 from .settings import SettingsManager, ChiselSettings
-from .settings_dialog import SettingsDialog
 from .tray import SystemTrayIcon
 from .hotkey import GlobalHotkeyManager
 from .processor import TextProcessor
-from .ai_client import AIClient, create_ai_client
+from .styles import apply_application_stylesheet
+
+# The settings dialog and the AI client stack (httpx, h2, orjson) are imported
+# on first use so they stay off the startup path
+if TYPE_CHECKING:
+    from .ai_client import AIClient
+
+
+def _client_config(settings: ChiselSettings) -> tuple:
+    """Settings that require a new AI client when they change."""
+    return (settings.api_provider, settings.current_api_key, settings.current_model, settings.api_timeout)
 
 
 class ChiselApp(QApplication):
     """Main application controller for Chisel."""
     
+    # Emitted from the hotkey listener thread; delivered on the Qt thread
+    hotkey_triggered = pyqtSignal()
+    
     def __init__(self, argv: list[str]):
         super().__init__(argv)
         
-        # Initialize logging
-        logger.add("chisel.log", rotation="1 MB", retention="10 days")
-        logger.info("Starting Chisel application")
-        
         # Core components
         self.settings_manager = SettingsManager()
         self.settings: Optional[ChiselSettings] = None
         self.tray_icon: Optional[SystemTrayIcon] = None
         self.hotkey_manager: Optional[GlobalHotkeyManager] = None
         self.text_processor: Optional[TextProcessor] = None
-        self.ai_client: Optional[AIClient] = None
+        self.ai_client: Optional["AIClient"] = None
         
         # Application state
         self.is_ready = False
+        self._processing_task: Optional[asyncio.Task] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
         
         # Set application properties
         self.setApplicationName("Chisel")
@@ -50,6 +61,11 @@ class ChiselApp(QApplication):
         # Prevent application from quitting when windows are closed
         self.setQuitOnLastWindowClosed(False)
         
+        # Parse the stylesheet once; dialogs pick it up via object names
+        apply_application_stylesheet(self)
+        
+        self.hotkey_triggered.connect(self.on_hotkey_pressed)
+        
     def initialize(self) -> bool:
         """Initialize all application components."""
         try:
@@ -58,6 +74,8 @@ class ChiselApp(QApplication):
             
             # Initialize AI client
             if self.settings.current_api_key:
+                from .ai_client import create_ai_client
+                
                 self.ai_client = create_ai_client(
                     api_provider=self.settings.api_provider.value,
                     api_key=self.settings.current_api_key,
@@ -72,7 +90,7 @@ class ChiselApp(QApplication):
                 logger.warning("No API key configured")
             
             # Initialize text processor
-            self.text_processor = TextProcessor(self.ai_client, self.settings)
+            self.text_processor = TextProcessor(self.ai_client, self.settings.snapshot())
             
             # Initialize system tray
             self.tray_icon = SystemTrayIcon()
@@ -84,7 +102,7 @@ class ChiselApp(QApplication):
             self.hotkey_manager = GlobalHotkeyManager()
             if not self.hotkey_manager.register_hotkey(
                 self.settings.global_hotkey,
-                self.on_hotkey_pressed
+                self.hotkey_triggered.emit
             ):
                 logger.error("Failed to register global hotkey")
                 self.tray_icon.show_message(
@@ -106,34 +124,63 @@ class ChiselApp(QApplication):
                 self.tray_icon.show_message("Chisel Error", f"Initialization failed: {e}")
             return False
     
+    def start_warm_up(self) -> None:
+        """
+        Open the AI client's connection ahead of the first hotkey press.
+        
+        Must be called once the event loop is set. The connection test and
+        the model fetch run concurrently; the models go into the model cache
+        so the settings dialog opens without a fetch.
+        """
+        if self.ai_client:
+            self._warm_up_task = asyncio.ensure_future(self._warm_up())
+    
+    async def _warm_up(self) -> None:
+        """Warm up the AI client and cache the models it lists."""
+        from . import model_cache
+        from .ai_client import get_fallback_models
+        
+        provider = self.settings.api_provider.value
+        api_key = self.settings.current_api_key
+        connected, models = await self.ai_client.warm_up()
+        if not connected:
+            logger.warning(f"Could not connect to {provider} at startup")
+            return
+        
+        # The fetch returns the built-in list on failure; don't cache that
+        if models != get_fallback_models(provider):
+            await asyncio.to_thread(model_cache.save_models, provider, model_cache.hash_api_key(api_key), models)
+    
     def on_hotkey_pressed(self) -> None:
         """Handle global hotkey press."""
         if not self.is_ready or not self.text_processor:
             return
+        
+        if self._processing_task and not self._processing_task.done():
+            logger.info("Text processing already in progress, ignoring hotkey")
+            return
             
         logger.info("Global hotkey pressed")
         self.tray_icon.update_status("Processing...")
         
-        # Schedule async processing
-        QTimer.singleShot(0, self.process_text_async)
+        # Run on the application's event loop so the AI client's
+        # connection pool survives between presses
+        self._processing_task = asyncio.ensure_future(self.text_processor.process_selected_text())
+        self._processing_task.add_done_callback(self._on_processing_done)
     
-    def process_text_async(self) -> None:
-        """Process text asynchronously."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
+    def _on_processing_done(self, task: asyncio.Task) -> None:
+        """Report the outcome of a text processing task."""
         try:
-            success = loop.run_until_complete(self.text_processor.process_selected_text())
-            
-            if success:
+            if task.result():
                 logger.info("Text processed successfully")
             else:
                 logger.warning("Text processing failed")
                 
+        except asyncio.CancelledError:
+            logger.info("Text processing cancelled")
         except Exception as e:
             logger.error(f"Error during text processing: {e}")
         finally:
-            loop.close()
             self.tray_icon.update_status("Ready")
     
     def show_settings(self) -> None:
@@ -145,7 +192,9 @@ class ChiselApp(QApplication):
             return
             
         try:
-            dialog = SettingsDialog(self.settings)
+            from .settings_dialog import SettingsDialog
+            
+            dialog = SettingsDialog(self.settings, self.settings_manager)
             dialog.settings_changed.connect(self.on_settings_changed)
             
             if dialog.exec() == SettingsDialog.DialogCode.Accepted:
@@ -163,13 +212,18 @@ class ChiselApp(QApplication):
     
     def on_settings_changed(self, new_settings: ChiselSettings) -> None:
         """Handle settings changes."""
-        logger.info("Settings updated, reinitializing components")
+        logger.info("Settings updated, reinitializing changed components")
         
         # Update current settings
+        old_settings = self.settings
         self.settings = new_settings
         
-        # Reinitialize AI client if API key or provider changed
-        if new_settings.current_api_key:
+        # Reinitialize AI client only if provider, key, model or timeout changed
+        client_changed = old_settings is None or _client_config(old_settings) != _client_config(new_settings)
+        if client_changed and new_settings.current_api_key:
+            from .ai_client import create_ai_client
+            
+            old_client = self.ai_client
             self.ai_client = create_ai_client(
                 api_provider=new_settings.api_provider.value,
                 api_key=new_settings.current_api_key,
@@ -186,17 +240,27 @@ class ChiselApp(QApplication):
                         f"Failed to initialize {new_settings.api_provider.value} client"
                     )
             
-            # Update text processor
-            if self.text_processor:
-                self.text_processor.ai_client = self.ai_client
-                self.text_processor.settings = new_settings
+            # Release the replaced client's pooled connections
+            if old_client:
+                asyncio.ensure_future(old_client.aclose())
+        
+        # Turning the response cache off also purges what it already holds
+        if old_settings is not None and old_settings.cache_responses and not new_settings.cache_responses:
+            from .response_cache import get_response_cache
+            get_response_cache().clear()
+        
+        # Update text processor
+        if self.text_processor:
+            self.text_processor.ai_client = self.ai_client
+            self.text_processor.settings = new_settings.snapshot()
         
         # Update hotkey if changed
-        if self.hotkey_manager:
+        hotkey_changed = old_settings is None or old_settings.global_hotkey != new_settings.global_hotkey
+        if self.hotkey_manager and hotkey_changed:
             self.hotkey_manager.unregister_all()
             if not self.hotkey_manager.register_hotkey(
                 new_settings.global_hotkey,
-                self.on_hotkey_pressed
+                self.hotkey_triggered.emit
             ):
                 logger.error("Failed to register new hotkey")
                 if self.tray_icon:
@@ -220,8 +284,29 @@ class ChiselApp(QApplication):
         if self.tray_icon:
             self.tray_icon.hide()
         
-        # Quit application
-        self.quit()
+        if self._processing_task and not self._processing_task.done():
+            self._processing_task.cancel()
+        
+        if self._warm_up_task and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+        
+        # Close pooled connections before the event loop stops
+        asyncio.ensure_future(self._shutdown())
+    
+    async def _shutdown(self) -> None:
+        """Close the AI clients' connections, then quit the application."""
+        try:
+            if self.ai_client:
+                await asyncio.wait_for(self.ai_client.aclose(), timeout=2.0)
+            
+            from .ai_client import shutdown_shared_client
+            await asyncio.wait_for(shutdown_shared_client(), timeout=2.0)
+            
+        except Exception as e:
+            logger.warning(f"Error closing AI client connections: {e}")
+        finally:
+            # Quit application
+            self.quit()
 
 
 def main() -> int:
@@ -234,13 +319,29 @@ def main() -> int:
         logger.error("System tray is not available")
         return 1
     
+    # Only set up the log file once the app can actually run. Records are
+    # written by loguru's background thread, and debug output stays off disk
+    logger.add("chisel.log", rotation="1 MB", retention="10 days", enqueue=True, level="INFO")
+    logger.info("Starting Chisel application")
+    
     # Initialize application components
     if not app.initialize():
         logger.error("Failed to initialize application")
         return 1
     
-    # Run application event loop
-    return app.exec()
+    # Run the Qt event loop as the asyncio loop for the app's lifetime
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    
+    app_close_event = asyncio.Event()
+    app.aboutToQuit.connect(app_close_event.set)
+    
+    app.start_warm_up()
+    
+    with loop:
+        loop.run_until_complete(app_close_event.wait())
+    
+    return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+"""
+Request batching for Chisel AI clients.
+
+Coalesces process_text calls that arrive close together into a single
+API request, so several rephrasings share one round trip.
+"""
+
+import re
+import asyncio
+import httpx
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Set, Tuple
+from loguru import logger
+
+from .ai_client import AIClient, ModelInfo
+
+
+# Batched texts are sent as index|text rows under a single header, so the
+# structure costs a few tokens per text instead of a repeated label block
+_BATCH_INSTRUCTION = (
+    "Apply the instruction below to the text in each row independently. "
+    "Newlines inside a text are written as \\n and backslashes as \\\\; escape your output the same way. "
+    "Reply with one index|result row per input row, in the same order, and nothing else."
+)
+
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+@dataclass(slots=True)
+class _BatchItem:
+    """A queued process_text call waiting for its result."""
+    text: str
+    prompt: str
+    temperature: float
+    top_p: float
+    future: asyncio.Future = field(repr=False)
+
+
+class BatchingAIClient:
+    """Wraps an AIClient and batches concurrent process_text calls."""
+
+    def __init__(self, client: AIClient, batch_window_ms: float = 20, max_batch: int = 8):
+        self.client = client
+        self.batch_window_ms = batch_window_ms
+        self.max_batch = max_batch
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # The loop only keeps weak references to tasks, so dispatches are held
+        # here until done; unresolved futures are failed by aclose()
+        self._dispatches: Set[asyncio.Task] = set()
+        self._pending: Set[asyncio.Future] = set()
+
+    @property
+    def model(self) -> str:
+        return self.client.model
+
+    async def process_text(self, text: str, prompt: str, temperature: float = 0.7, top_p: float = 0.8, use_cache: bool = True) -> Optional[str]:
+        """
+        Queue text for processing and wait for its result.
+
+        Args:
+            text: Text to process
+            prompt: Processing prompt/instruction
+            temperature: Temperature for generation
+            top_p: Top-p for generation
+            use_cache: False to bypass the response cache; such text is sent
+                on its own so it never ends up in a cached batch
+
+        Returns:
+            Optional[str]: Processed text, or None if processing failed
+        """
+        if not text.strip():
+            logger.warning("Empty text provided for processing")
+            return None
+
+        if not use_cache:
+            return await self.client.process_text(text, prompt, temperature, top_p, use_cache=False)
+
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        await queue.put(_BatchItem(text, prompt, temperature, top_p, future))
+        return await future
+
+    async def test_connection(self, client: Optional[httpx.AsyncClient] = None) -> bool:
+        """Test the wrapped client's API connection."""
+        return await self.client.test_connection(client)
+
+    async def fetch_available_models(self, client: Optional[httpx.AsyncClient] = None) -> List[ModelInfo]:
+        """Fetch available models through the wrapped client."""
+        return await self.client.fetch_available_models(client)
+
+    async def aclose(self) -> None:
+        """Stop the batching worker, fail outstanding calls and close the wrapped client."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+            self._queue = None
+            self._loop = None
+
+        for task in list(self._dispatches):
+            task.cancel()
+
+        # Queued, batching and in-flight calls would otherwise wait forever
+        for future in list(self._pending):
+            if not future.done():
+                future.set_exception(RuntimeError("client closed"))
+
+        await self.client.aclose()
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start the batching worker for the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Collect queued calls into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        window = self.batch_window_ms / 1000
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + window
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Only calls sharing a prompt and sampling settings can be merged
+            groups: Dict[Tuple[str, float, float], List[_BatchItem]] = {}
+            for item in batch:
+                groups.setdefault((item.prompt, item.temperature, item.top_p), []).append(item)
+
+            for items in groups.values():
+                task = loop.create_task(self._dispatch(items))
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, items: List[_BatchItem]) -> None:
+        """Process one group of compatible calls and resolve their futures."""
+        try:
+            if len(items) == 1:
+                results = [await self._process_single(items[0])]
+            else:
+                results = await self._process_batch(items)
+        except Exception as e:
+            logger.error(f"Batched AI processing failed: {e}")
+            results = [None] * len(items)
+
+        for item, result in zip(items, results):
+            if not item.future.done():
+                item.future.set_result(result)
+
+    async def _process_single(self, item: _BatchItem) -> Optional[str]:
+        return await self.client.process_text(item.text, item.prompt, item.temperature, item.top_p)
+
+    async def _process_batch(self, items: List[_BatchItem]) -> List[Optional[str]]:
+        """Send several texts in one request, falling back per item on bad output."""
+        first = items[0]
+        rows = "\n".join(f"{i}|{_escape(item.text)}" for i, item in enumerate(items, 1))
+        combined = f"index|text\n{rows}"
+        prompt = f"{_BATCH_INSTRUCTION}\n\nInstruction: {first.prompt}"
+
+        logger.info(f"Sending {len(items)} texts in one batched request")
+        output = await self.client.process_text(combined, prompt, first.temperature, first.top_p)
+
+        results: List[Optional[str]] = [None] * len(items)
+        if output:
+            for i, text in _parse_rows(output).items():
+                if 1 <= i <= len(items) and text:
+                    results[i - 1] = text
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"Batched response missing {len(missing)} results, retrying individually")
+            retried = await asyncio.gather(*(self._process_single(items[i]) for i in missing))
+            for i, result in zip(missing, retried):
+                results[i] = result
+
+        return results
+
+
+def _escape(text: str) -> str:
+    """Fit a text on one row by escaping backslashes and newlines."""
+    return text.replace("\\", "\\\\").replace("\r\n", "\n").replace("\n", "\\n")
+
+
+def _unescape(text: str) -> str:
+    """Reverse _escape()."""
+    return _ESCAPE_RE.sub(lambda m: "\n" if m.group(1) == "n" else m.group(1), text)
+
+
+def _parse_rows(output: str) -> Dict[int, str]:
+    """Parse index|result rows from a batched response."""
+    results: Dict[int, str] = {}
+    for line in output.splitlines():
+        index, sep, value = line.partition("|")
+        index = index.strip()
+        if sep and index.isdigit():
+            results[int(index)] = _unescape(value.strip())
+    return results
@@ -4,19 +4,52 @@ Clipboard operations for Chisel application.
 Provides safe clipboard handling with backup and restore functionality.
 """
 
+import sys
 import time
+import asyncio
 from typing import Optional
-import pyperclip
+from PyQt6.QtGui import QClipboard, QGuiApplication
 from loguru import logger
 
 
+# Qt on macOS only notices clipboard changes made by other apps while this
+# app is active, so a background tray app has to poll there
+_POLL_FOR_CHANGES = sys.platform == "darwin"
+
+
 class ClipboardManager:
     """Manages clipboard operations with safety and backup features."""
     
     def __init__(self):
         self._last_backup: Optional[str] = None
+        self._qt_clipboard: Optional[QClipboard] = None
+        # Last text this manager put on the clipboard ("" after clear())
+        self._last_set: Optional[str] = None
         logger.info("Clipboard manager initialized")
     
+    @property
+    def qt_clipboard(self) -> Optional[QClipboard]:
+        """The application's QClipboard, or None before a Qt app exists."""
+        if self._qt_clipboard is None and QGuiApplication.instance() is not None:
+            self._qt_clipboard = QGuiApplication.clipboard()
+        return self._qt_clipboard
+    
+    @property
+    def polls_for_changes(self) -> bool:
+        """Whether change detection polls, and so misses a copy of identical text."""
+        return _POLL_FOR_CHANGES
+    
+    def _require_clipboard(self) -> QClipboard:
+        """The QClipboard, raising if no Qt application exists yet."""
+        clipboard = self.qt_clipboard
+        if clipboard is None:
+            raise RuntimeError("no Qt application to provide a clipboard")
+        return clipboard
+    
+    def _holds(self, clipboard: QClipboard, text: str) -> bool:
+        """Whether the clipboard still holds text last set by this manager."""
+        return self._last_set == text and clipboard.ownsClipboard()
+    
     def get_clipboard_safely(self) -> Optional[str]:
         """
         Safely get clipboard content.
@@ -25,8 +58,8 @@ class ClipboardManager:
             Optional[str]: Clipboard content or None if error
         """
         try:
-            content = pyperclip.paste()
-            logger.debug(f"Clipboard read: {len(content) if content else 0} characters")
+            content = self._require_clipboard().text()
+            logger.opt(lazy=True).debug("Clipboard read: {} characters", lambda: len(content) if content else 0)
             return content
         except Exception as e:
             logger.error(f"Error reading clipboard: {e}")
@@ -43,8 +76,13 @@ class ClipboardManager:
             bool: True if successful
         """
         try:
-            pyperclip.copy(text)
-            logger.debug(f"Clipboard set: {len(text)} characters")
+            clipboard = self._require_clipboard()
+            if self._holds(clipboard, text):
+                return True
+            
+            clipboard.setText(text)
+            self._last_set = text
+            logger.opt(lazy=True).debug("Clipboard set: {} characters", lambda: len(text))
             return True
         except Exception as e:
             logger.error(f"Error setting clipboard: {e}")
@@ -58,7 +96,12 @@ class ClipboardManager:
             bool: True if successful
         """
         try:
-            pyperclip.copy("")
+            clipboard = self._require_clipboard()
+            if self._holds(clipboard, ""):
+                return True
+            
+            clipboard.clear()
+            self._last_set = ""
             logger.debug("Clipboard cleared")
             return True
         except Exception as e:
@@ -99,31 +142,76 @@ class ClipboardManager:
             logger.warning("No clipboard backup available to restore")
             return False
     
-    def wait_for_clipboard_change(self, timeout: float = 2.0) -> Optional[str]:
+    async def wait_for_clipboard_change(self, timeout: float = 2.0, initial_content: Optional[str] = None) -> Optional[str]:
         """
-        Wait for clipboard content to change.
+        Wait for clipboard content to change by polling.
+        
+        Checks quickly at first and backs off from 5 ms to 50 ms between
+        reads, so fast copies return promptly and slow ones don't spin.
         
         Args:
             timeout: Maximum time to wait in seconds
+            initial_content: Content to compare against, read before the
+                action that changes the clipboard; None reads it now, which
+                misses a change that has already landed
             
         Returns:
             Optional[str]: New clipboard content or None if timeout/error
         """
-        initial_content = self.get_clipboard_safely()
-        start_time = time.time()
+        if initial_content is None:
+            initial_content = self.get_clipboard_safely()
+        deadline = time.monotonic() + timeout
+        delay = 0.005
         
-        while time.time() - start_time < timeout:
-            current_content = self.get_clipboard_safely()
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
             
+            current_content = self.get_clipboard_safely()
             if current_content != initial_content:
                 logger.debug("Clipboard change detected")
                 return current_content
-            
-            time.sleep(0.05)  # Small delay between checks
         
         logger.debug("Clipboard change timeout")
         return None
     
+    async def wait_for_clipboard_change_async(self, timeout: float = 2.0, initial_content: Optional[str] = None) -> Optional[str]:
+        """
+        Wait for the clipboard to change without polling.
+        
+        Listens for QClipboard.dataChanged, so it must run on the Qt
+        thread's event loop. Polls instead on platforms where the signal
+        isn't delivered to background apps.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            initial_content: Content before the change, used when polling;
+                see wait_for_clipboard_change()
+            
+        Returns:
+            Optional[str]: New clipboard content or None if timeout/error
+        """
+        clipboard = self.qt_clipboard
+        if clipboard is None:
+            logger.error("Cannot watch clipboard: no Qt application")
+            return None
+        
+        if _POLL_FOR_CHANGES:
+            return await self.wait_for_clipboard_change(timeout, initial_content)
+        
+        changed = asyncio.Event()
+        clipboard.dataChanged.connect(changed.set)
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.debug("Clipboard change timeout")
+            return None
+        finally:
+            clipboard.dataChanged.disconnect(changed.set)
+        
+        logger.debug("Clipboard change detected")
+        return clipboard.text()
+    
     def is_clipboard_empty(self) -> bool:
         """
         Check if clipboard is empty or contains only whitespace.
@@ -132,7 +220,7 @@ class ClipboardManager:
             bool: True if clipboard is empty
         """
         content = self.get_clipboard_safely()
-        return not content or not content.strip()
+        return not content or content.isspace()
     
     def get_clipboard_info(self) -> dict:
         """
@@ -145,8 +233,8 @@ class ClipboardManager:
         
         return {
             "has_content": content is not None,
-            "is_empty": not content or not content.strip() if content else True,
+            "is_empty": not content or content.isspace(),
             "length": len(content) if content else 0,
             "has_backup": self._last_backup is not None,
             "backup_length": len(self._last_backup) if self._last_backup else 0
-        }
\ No newline at end of file
+        }
@@ -5,7 +5,7 @@ Provides cross-platform global hotkey registration and handling.
 """
 
 import platform
-from typing import Callable, List, Optional
+from typing import Callable, Optional
 from pynput import keyboard
 from loguru import logger
 
@@ -14,12 +14,32 @@ class GlobalHotkeyManager:
     """Cross-platform global hotkey registration and management."""
     
     def __init__(self):
-        self.listeners: List[keyboard.GlobalHotKeys] = []
+        # A single listener thread serves every registered hotkey
+        self.listener: Optional[keyboard.GlobalHotKeys] = None
         self.hotkey_callbacks: dict[str, Callable] = {}
         self.platform = platform.system().lower()
         
         logger.info(f"Global hotkey manager initialized for platform: {self.platform}")
     
+    def _replace_listener(self, callbacks: dict[str, Callable]) -> None:
+        """
+        Swap the running listener for one serving the given hotkeys.
+        
+        The new listener is built before the old one is stopped, so an
+        invalid hotkey leaves the current registrations running.
+        
+        Args:
+            callbacks: Mapping of hotkey combination strings to callbacks
+        """
+        new_listener = keyboard.GlobalHotKeys(callbacks) if callbacks else None
+        
+        if self.listener is not None:
+            self.listener.stop()
+        
+        self.listener = new_listener
+        if new_listener is not None:
+            new_listener.start()
+    
     def register_hotkey(self, keys: str, callback: Callable) -> bool:
         """
         Register a global hotkey.
@@ -32,17 +52,9 @@ class GlobalHotkeyManager:
             bool: True if hotkey was registered successfully
         """
         try:
-            # Store callback
-            self.hotkey_callbacks[keys] = callback
-            
-            # Create hotkey listener
-            hotkey_listener = keyboard.GlobalHotKeys({
-                keys: callback
-            })
-            
-            # Start listening
-            hotkey_listener.start()
-            self.listeners.append(hotkey_listener)
+            callbacks = {**self.hotkey_callbacks, keys: callback}
+            self._replace_listener(callbacks)
+            self.hotkey_callbacks = callbacks
             
             logger.info(f"Global hotkey registered: {keys}")
             return True
@@ -61,18 +73,17 @@ class GlobalHotkeyManager:
         Returns:
             bool: True if hotkey was unregistered successfully
         """
-        try:
-            # Find and stop the listener for this hotkey
-            for i, listener in enumerate(self.listeners):
-                if keys in self.hotkey_callbacks:
-                    listener.stop()
-                    self.listeners.pop(i)
-                    del self.hotkey_callbacks[keys]
-                    logger.info(f"Global hotkey unregistered: {keys}")
-                    return True
-            
+        if keys not in self.hotkey_callbacks:
             logger.warning(f"Hotkey not found for unregistration: {keys}")
             return False
+        
+        try:
+            callbacks = {k: v for k, v in self.hotkey_callbacks.items() if k != keys}
+            self._replace_listener(callbacks)
+            self.hotkey_callbacks = callbacks
+            
+            logger.info(f"Global hotkey unregistered: {keys}")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to unregister global hotkey '{keys}': {e}")
@@ -82,13 +93,13 @@ class GlobalHotkeyManager:
         """Unregister all hotkeys and clean up listeners."""
         logger.info("Unregistering all global hotkeys")
         
-        for listener in self.listeners:
+        if self.listener is not None:
             try:
-                listener.stop()
+                self.listener.stop()
             except Exception as e:
                 logger.error(f"Error stopping hotkey listener: {e}")
         
-        self.listeners.clear()
+        self.listener = None
         self.hotkey_callbacks.clear()
         
         logger.info("All global hotkeys unregistered")
@@ -133,7 +144,9 @@ class GlobalHotkeyManager:
     
     def test_hotkey(self, keys: str) -> bool:
         """
-        Test if a hotkey can be registered (for validation).
+        Test if a hotkey string is valid (for validation).
+        
+        Only parses the combination; no OS keyboard hook is installed.
         
         Args:
             keys: Hotkey combination string to test
@@ -141,18 +154,12 @@ class GlobalHotkeyManager:
         Returns:
             bool: True if hotkey can be registered
         """
-        def test_callback():
-            pass
-        
         try:
-            # Try to register temporarily
-            test_listener = keyboard.GlobalHotKeys({keys: test_callback})
-            test_listener.start()
-            test_listener.stop()
+            keyboard.HotKey.parse(keys)
             
             logger.debug(f"Hotkey test successful: {keys}")
             return True
             
-        except Exception as e:
+        except ValueError as e:
             logger.warning(f"Hotkey test failed for '{keys}': {e}")
-            return False
\ No newline at end of file
+            return False
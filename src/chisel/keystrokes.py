@@ -0,0 +1,93 @@
+"""
+Keystroke injection for Chisel application.
+
+On Windows, Ctrl+<key> combinations are sent as one SendInput call from
+INPUT arrays built at import, so the four key events can't be split by
+other input. Other platforms return False and use pynput instead.
+"""
+
+import sys
+import ctypes
+from typing import Any, Dict
+
+
+# Prebuilt INPUT arrays for each supported combination, keyed by character
+_COMBOS: Dict[str, Any] = {}
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _INPUT_KEYBOARD = 1
+    _KEYEVENTF_KEYUP = 0x0002
+    _VK_CONTROL = 0x11
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _HARDWAREINPUT(ctypes.Structure):
+        _fields_ = [
+            ("uMsg", wintypes.DWORD),
+            ("wParamL", wintypes.WORD),
+            ("wParamH", wintypes.WORD),
+        ]
+
+    # The union must include every member so sizeof(INPUT) matches Windows
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+    _user32.SendInput.restype = wintypes.UINT
+    _INPUT_SIZE = ctypes.sizeof(_INPUT)
+
+    def _key_event(vk: int, flags: int = 0) -> "_INPUT":
+        return _INPUT(type=_INPUT_KEYBOARD, union=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+    def _build_combo(key: str) -> Any:
+        """Build the Ctrl down, key down, key up, Ctrl up sequence for a letter."""
+        vk = ord(key.upper())  # Virtual-key codes for A-Z match their ASCII values
+        return (_INPUT * 4)(
+            _key_event(_VK_CONTROL),
+            _key_event(vk),
+            _key_event(vk, _KEYEVENTF_KEYUP),
+            _key_event(_VK_CONTROL, _KEYEVENTF_KEYUP),
+        )
+
+    _COMBOS = {key: _build_combo(key) for key in ("c", "v")}
+
+
+def send_ctrl_combo(key: str) -> bool:
+    """
+    Send Ctrl+<key> through the native fast path, if there is one.
+
+    Args:
+        key: Character to combine with Ctrl
+
+    Returns:
+        bool: True if the keystrokes were sent; False if the caller should
+        fall back to pynput
+    """
+    inputs = _COMBOS.get(key)
+    if inputs is None:
+        return False
+
+    return _user32.SendInput(len(inputs), inputs, _INPUT_SIZE) == len(inputs)
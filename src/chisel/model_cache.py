@@ -0,0 +1,118 @@
+"""
+On-disk cache of provider model lists for Chisel.
+
+Lets the settings dialog show models without a network round trip each
+time it opens; entries older than the TTL are shown and then refreshed.
+"""
+
+import os
+import time
+import tempfile
+import threading
+import hashlib
+from pathlib import Path
+from typing import Optional, List, Tuple, Dict
+import orjson
+from loguru import logger
+
+from .ai_client import ModelInfo
+
+
+MODEL_CACHE_TTL = 72 * 60 * 60  # seconds
+
+_CACHE_FILE = Path.home() / ".chisel" / "models_cache.json"
+
+# Saves run on worker threads; serializes the file's read-modify-write and
+# every access to _memory
+_lock = threading.Lock()
+
+# Entries already read or written this session, so reopening the settings
+# dialog doesn't re-read and re-parse the file: {cache key: (models, fetched_at)}
+_memory: Dict[str, Tuple[List[ModelInfo], float]] = {}
+
+
+def hash_api_key(api_key: str) -> str:
+    """
+    Derive the cache key for an API key, so raw keys never reach disk.
+
+    Args:
+        api_key: Provider API key
+
+    Returns:
+        str: Hex digest identifying the key
+    """
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+
+def _read_cache() -> dict:
+    """Read the whole cache file; empty if missing or unreadable."""
+    try:
+        return orjson.loads(_CACHE_FILE.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Model cache unreadable, ignoring: {e}")
+        return {}
+
+
+def load_models(provider: str, key_hash: str) -> Tuple[Optional[List[ModelInfo]], float]:
+    """
+    Look up the cached model list for a provider and key.
+
+    Args:
+        provider: API provider name
+        key_hash: Result of hash_api_key()
+
+    Returns:
+        Tuple[Optional[List[ModelInfo]], float]: Cached models (None if
+        absent) and their age in seconds
+    """
+    cache_key = f"{provider}:{key_hash}"
+    with _lock:
+        if cache_key not in _memory:
+            entry = _read_cache().get(cache_key)
+            if not entry:
+                return None, 0.0
+
+            try:
+                models = [ModelInfo(**model) for model in entry["models"]]
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Ignoring malformed model cache entry: {e}")
+                return None, 0.0
+
+            _memory[cache_key] = (models, entry.get("fetched_at", 0))
+
+        models, fetched_at = _memory[cache_key]
+    return list(models), time.time() - fetched_at
+
+
+def save_models(provider: str, key_hash: str, models: List[ModelInfo]) -> None:
+    """
+    Store the model list for a provider and key.
+
+    Args:
+        provider: API provider name
+        key_hash: Result of hash_api_key()
+        models: Models fetched from the provider
+    """
+    cache_key = f"{provider}:{key_hash}"
+    fetched_at = time.time()
+
+    with _lock:
+        _memory[cache_key] = (list(models), fetched_at)
+
+        cache = _read_cache()
+        cache[cache_key] = {"fetched_at": fetched_at, "models": models}
+
+        tmp_path: Optional[str] = None
+        try:
+            _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=_CACHE_FILE.parent, suffix=".tmp", delete=False) as tmp_file:
+                tmp_path = tmp_file.name
+                tmp_file.write(orjson.dumps(cache))
+            os.replace(tmp_path, _CACHE_FILE)
+            logger.debug(f"Cached {len(models)} {provider} models")
+        except OSError as e:
+            logger.warning(f"Failed to write model cache: {e}")
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
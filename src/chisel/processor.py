@@ -4,25 +4,41 @@ Text processing workflow for Chisel application.
 Handles text capture, AI processing, and text replacement operations.
 """
 
-import asyncio
-import time
-from typing import Optional
+import re
+from typing import Optional, TYPE_CHECKING
 from pynput import keyboard
+from PyQt6.QtCore import QTimer
 from loguru import logger
 
-from .ai_client import AIClient, create_ai_client
-from .settings import ChiselSettings
+from .settings import SettingsSnapshot
 from .clipboard import ClipboardManager
+from .keystrokes import send_ctrl_combo
+
+if TYPE_CHECKING:
+    from .ai_client import AIClient
+
+
+# How long the target app gets to read the pasted text before the user's
+# clipboard is put back
+_RESTORE_DELAY_MS = 150
+
+# Potentially sensitive content (basic check), matched case-insensitively in
+# a single pass over the text
+_SENSITIVE_RE = re.compile(
+    r"password|token|key|secret|credit card|ssn|social security",
+    re.IGNORECASE
+)
 
 
 class TextProcessor:
     """Manages the core text processing workflow."""
     
-    def __init__(self, ai_client: Optional[AIClient], settings: ChiselSettings):
+    def __init__(self, ai_client: Optional["AIClient"], settings: SettingsSnapshot):
         self.ai_client = ai_client
         self.settings = settings
         self.keyboard = keyboard.Controller()
         self.clipboard = ClipboardManager()
+        self._pending_restore: Optional[str] = None
         
         logger.info("Text processor initialized")
     
@@ -37,13 +53,16 @@ class TextProcessor:
             logger.error("No AI client available")
             return False
         
+        # Put back the clipboard from a previous run before backing it up again
+        self._restore_clipboard()
+        
         # Backup current clipboard
         original_clipboard = self.clipboard.get_clipboard_safely()
         logger.debug("Original clipboard backed up")
         
         try:
             # Step 1: Capture selected text
-            selected_text = await self.capture_selected_text()
+            selected_text = await self.capture_selected_text(original_clipboard)
             if not selected_text:
                 logger.warning("No text was captured")
                 return False
@@ -55,12 +74,15 @@ class TextProcessor:
             
             logger.info(f"Captured text: {len(selected_text)} characters")
             
-            # Step 2: Process with AI
+            # Step 2: Process with AI; text that looks sensitive is never
+            # written to the response cache
+            use_cache = self.settings.cache_responses and not _SENSITIVE_RE.search(selected_text)
             processed_text = await self.ai_client.process_text(
                 text=selected_text,
                 prompt=self.settings.current_prompt,
                 temperature=self.settings.temperature,
-                top_p=self.settings.top_p
+                top_p=self.settings.top_p,
+                use_cache=use_cache
             )
             
             if not processed_text:
@@ -84,51 +106,62 @@ class TextProcessor:
             return False
             
         finally:
-            # Restore original clipboard after a delay
+            # Restore original clipboard once the paste has had time to land,
+            # without holding up this coroutine
             if original_clipboard:
-                await asyncio.sleep(0.5)  # Give time for paste operation
-                self.clipboard.set_clipboard_safely(original_clipboard)
-                logger.debug("Original clipboard restored")
+                self._pending_restore = original_clipboard
+                QTimer.singleShot(_RESTORE_DELAY_MS, self._restore_clipboard)
     
-    async def capture_selected_text(self) -> Optional[str]:
+    def _restore_clipboard(self) -> None:
+        """Restore the clipboard saved by the last run, if still pending."""
+        if self._pending_restore is None:
+            return
+        
+        self.clipboard.set_clipboard_safely(self._pending_restore)
+        self._pending_restore = None
+        logger.debug("Original clipboard restored")
+    
+    async def capture_selected_text(self, original_clipboard: Optional[str] = None) -> Optional[str]:
         """
         Capture selected text using clipboard operations.
         
+        Args:
+            original_clipboard: Clipboard content read just before the copy,
+                used to tell a failed copy from the selection
+            
         Returns:
             Optional[str]: The captured text, or None if capture failed
         """
-        max_retries = 3
-        base_delay = 0.1
-        
-        for attempt in range(max_retries):
-            try:
-                # Clear clipboard
+        try:
+            # Clear the clipboard so a failed copy isn't mistaken for the
+            # selection, unless the prior content is known to compare against
+            # and a copy of identical text would still be noticed
+            if original_clipboard is None or self.clipboard.polls_for_changes:
                 self.clipboard.clear()
-                await asyncio.sleep(0.05)
-                
-                # Simulate Ctrl+C to copy selected text
-                self.keyboard.press(keyboard.Key.ctrl)
-                self.keyboard.press('c')
-                self.keyboard.release('c')
-                self.keyboard.release(keyboard.Key.ctrl)
-                
-                # Wait with increasing delay
-                delay = base_delay * (attempt + 1)
-                await asyncio.sleep(delay)
-                
-                # Check if clipboard has new content
+            
+            # Polling compares against a snapshot, which must be taken before
+            # the copy or a fast copy would already be in it
+            baseline = self.clipboard.get_clipboard_safely() if self.clipboard.polls_for_changes else None
+            
+            # Simulate Ctrl+C to copy selected text
+            self._send_combo('c')
+            
+            # dataChanged fires as soon as the copy lands; read once more on
+            # timeout in case the signal was missed
+            clipboard_content = await self.clipboard.wait_for_clipboard_change_async(timeout=0.5, initial_content=baseline)
+            if clipboard_content is None:
                 clipboard_content = self.clipboard.get_clipboard_safely()
-                
-                if clipboard_content and clipboard_content.strip():
-                    logger.debug(f"Text captured on attempt {attempt + 1}")
-                    return clipboard_content.strip()
-                
-                logger.debug(f"Capture attempt {attempt + 1} failed, retrying...")
-                
-            except Exception as e:
-                logger.warning(f"Error during capture attempt {attempt + 1}: {e}")
+                if clipboard_content == original_clipboard:
+                    clipboard_content = None
+            
+            if clipboard_content and clipboard_content.strip():
+                logger.debug("Text captured")
+                return clipboard_content.strip()
+            
+        except Exception as e:
+            logger.warning(f"Error during text capture: {e}")
         
-        logger.error("Failed to capture selected text after all retries")
+        logger.error("Failed to capture selected text")
         return None
     
     def replace_selected_text(self, new_text: str) -> bool:
@@ -143,16 +176,11 @@ class TextProcessor:
         """
         try:
             # Copy new text to clipboard
+            # (the Qt clipboard updates synchronously, so no settle delay is needed)
             self.clipboard.set_clipboard_safely(new_text)
             
-            # Small delay to ensure clipboard is updated
-            time.sleep(0.1)
-            
             # Simulate Ctrl+V to paste new text
-            self.keyboard.press(keyboard.Key.ctrl)
-            self.keyboard.press('v')
-            self.keyboard.release('v')
-            self.keyboard.release(keyboard.Key.ctrl)
+            self._send_combo('v')
             
             logger.debug("Text replacement completed")
             return True
@@ -161,6 +189,21 @@ class TextProcessor:
             logger.error(f"Error during text replacement: {e}")
             return False
     
+    def _send_combo(self, key: str) -> None:
+        """
+        Send Ctrl+<key> as one press/tap/release sequence.
+        
+        Uses a single native SendInput call where available.
+        
+        Args:
+            key: Character to combine with Ctrl
+        """
+        if send_ctrl_combo(key):
+            return
+        
+        with self.keyboard.pressed(keyboard.Key.ctrl):
+            self.keyboard.tap(key)
+    
     def validate_text(self, text: str) -> bool:
         """
         Validate text before processing.
@@ -177,16 +220,9 @@ class TextProcessor:
         if len(text) > self.settings.max_text_length:
             return False
         
-        # Check for potentially sensitive content (basic check)
-        sensitive_patterns = [
-            "password", "token", "key", "secret",
-            "credit card", "ssn", "social security"
-        ]
-        
-        text_lower = text.lower()
-        for pattern in sensitive_patterns:
-            if pattern in text_lower:
-                logger.warning(f"Potentially sensitive content detected: {pattern}")
-                return False
+        match = _SENSITIVE_RE.search(text)
+        if match:
+            logger.warning(f"Potentially sensitive content detected: {match.group(0).lower()}")
+            return False
         
         return True
\ No newline at end of file
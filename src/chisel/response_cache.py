@@ -0,0 +1,198 @@
+"""
+Persistent cache of AI responses for Chisel.
+
+Repeating a rephrase of the same text with the same prompt and settings is
+answered from this cache instead of another API round trip.
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+from loguru import logger
+
+
+DEFAULT_TTL = 7 * 24 * 60 * 60  # seconds
+
+# Cached responses hold the user's text, so they live in the per-user cache
+# directory rather than next to the settings
+DEFAULT_DB_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "chisel" / "llm_cache.db"
+
+
+class ResponseCache:
+    """Two-tier response cache: an in-memory LRU in front of SQLite."""
+
+    def __init__(self, db_path: Optional[Path] = None, ttl: float = DEFAULT_TTL, memory_size: int = 16):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        self.ttl = ttl
+        self.memory_size = memory_size
+
+        self._memory: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_failed = False
+        self._db_lock = threading.Lock()
+
+        # One lock per in-flight key so identical concurrent requests make a
+        # single API call; entries vanish once no request holds them
+        self._key_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, text: str, temperature: float, top_p: float) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model name
+            prompt: Processing prompt
+            text: Text to process
+            temperature: Temperature for generation
+            top_p: Top-p for generation
+
+        Returns:
+            str: SHA-256 hex digest identifying the request
+        """
+        raw = f"{model}|{temperature}|{top_p}|{prompt}|{text}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def lock(self, key: str) -> asyncio.Lock:
+        """Get the lock that serializes requests for a key."""
+        key_lock = self._key_locks.get(key)
+        if key_lock is None:
+            key_lock = asyncio.Lock()
+            self._key_locks[key] = key_lock
+        return key_lock
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Optional[str]: Cached response, or None if missing or expired
+        """
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if now - created_at <= self.ttl:
+                self._memory.move_to_end(key)
+                return value
+            del self._memory[key]
+
+        conn = self._connect()
+        if conn is None:
+            return None
+
+        try:
+            with self._db_lock:
+                row = conn.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+        if row is None or now - row[1] > self.ttl:
+            return None
+
+        self._remember(key, row[0], row[1])
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key()
+            value: Response text
+        """
+        created_at = int(time.time())
+        self._remember(key, value, created_at)
+
+        conn = self._connect()
+        if conn is None:
+            return
+
+        try:
+            with self._db_lock, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, created_at)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._memory.clear()
+
+        conn = self._connect()
+        if conn is None:
+            return
+
+        try:
+            with self._db_lock, conn:
+                conn.execute("DELETE FROM responses")
+            logger.info("Response cache cleared")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear response cache: {e}")
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        """Put an entry in the in-memory LRU, evicting the oldest on overflow."""
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; None if it is unavailable."""
+        if self._conn is not None or self._db_failed:
+            return self._conn
+
+        with self._db_lock:
+            if self._conn is not None or self._db_failed:
+                return self._conn
+
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS responses ("
+                        "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at INTEGER NOT NULL)"
+                    )
+                    conn.execute(
+                        "DELETE FROM responses WHERE created_at < ?",
+                        (int(time.time() - self.ttl),)
+                    )
+                self._conn = conn
+                logger.debug(f"Response cache opened at {self.db_path}")
+            except (sqlite3.Error, OSError) as e:
+                # Fall back to the in-memory tier only
+                logger.warning(f"Response cache unavailable: {e}")
+                self._db_failed = True
+
+        return self._conn
+
+
+_default_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache."""
+    global _default_cache
+
+    if _default_cache is None:
+        _default_cache = ResponseCache()
+    return _default_cache
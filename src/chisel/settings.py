@@ -4,15 +4,46 @@ Settings management for Chisel application.
 Handles configuration persistence, API key secure storage, and settings validation.
 """
 
-import json
-import keyring
+import os
+import queue
+import atexit
+import threading
+from concurrent.futures import Future
+from types import ModuleType
+from dataclasses import dataclass, fields
+import orjson
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Literal, Union
 from enum import Enum
 from loguru import logger
 
 
+# Stamp written into settings.json by save_settings(). Only files carrying the
+# current stamp are trusted and loaded without validation; anything else
+# (older releases, hand edits) is validated once and rewritten. Bump this
+# whenever ChiselSettings fields or their constraints change.
+SCHEMA_VERSION = 2
+_SCHEMA_KEY = "_schema_version"
+
+# Fields kept in the keyring rather than the config file
+_SECRET_FIELDS = frozenset({"api_key", "google_api_key", "openrouter_api_key"})
+
+# Keyring entries read by load_settings(), prefetched together at startup
+_SECRET_KEYS = ("google_api_key", "api_key", "openrouter_api_key")
+
+
+def _keyring() -> ModuleType:
+    """
+    Import keyring on first use.
+    
+    Importing it discovers the platform backend (D-Bus probing on Linux),
+    so it is kept off startup and normally happens on the prefetch thread.
+    """
+    import keyring
+    return keyring
+
+
 class APIProvider(str, Enum):
     """Supported API providers."""
     GOOGLE = "google"
@@ -83,29 +114,28 @@ class ChiselSettings(BaseModel):
     # Advanced Settings
     api_timeout: int = Field(default=30, ge=5, le=120)
     max_text_length: int = Field(default=5000, ge=100, le=50000)
+    cache_responses: bool = Field(
+        default=True,
+        description="Keep AI responses on disk to answer repeated requests"
+    )
     
-    class Config:
-        """Pydantic configuration."""
-        validate_assignment = True
+    # Assignments stay validated so the numeric bounds hold
+    model_config = ConfigDict(validate_assignment=True)
     
     # Helper properties for current provider
     @property
     def current_api_key(self) -> Optional[str]:
         """Get API key for current provider."""
-        if self.api_provider == APIProvider.GOOGLE:
-            return self.google_api_key or self.api_key  # Fallback to legacy
-        elif self.api_provider == APIProvider.OPENROUTER:
-            return self.openrouter_api_key
-        return None
+        return _current_api_key(self)
     
     @property 
     def current_model(self) -> str:
         """Get model for current provider."""
-        if self.api_provider == APIProvider.GOOGLE:
-            return self.google_model or self.ai_model or "gemini-2.5-pro"
-        elif self.api_provider == APIProvider.OPENROUTER:
-            return self.openrouter_model
-        return "gemini-2.5-pro"
+        return _current_model(self)
+    
+    def snapshot(self) -> "SettingsSnapshot":
+        """Get an immutable copy of these settings for read-only use."""
+        return SettingsSnapshot(**{name: getattr(self, name) for name in _SNAPSHOT_FIELDS})
     
     def set_current_api_key(self, api_key: str) -> None:
         """Set API key for current provider."""
@@ -122,6 +152,195 @@ class ChiselSettings(BaseModel):
             self.openrouter_model = model
 
 
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """
+    Immutable, already-validated view of ChiselSettings.
+    
+    Handed to components that only read settings (such as the text
+    processor on every hotkey press); editing goes through ChiselSettings.
+    """
+    api_provider: APIProvider
+    google_api_key: Optional[str]
+    google_model: str
+    openrouter_api_key: Optional[str]
+    openrouter_model: str
+    api_key: Optional[str]
+    ai_model: Optional[str]
+    current_prompt: str
+    temperature: float
+    top_p: float
+    global_hotkey: str
+    show_notifications: bool
+    auto_start: bool
+    api_timeout: int
+    max_text_length: int
+    cache_responses: bool
+    
+    @property
+    def current_api_key(self) -> Optional[str]:
+        """Get API key for current provider."""
+        return _current_api_key(self)
+    
+    @property
+    def current_model(self) -> str:
+        """Get model for current provider."""
+        return _current_model(self)
+
+
+_SNAPSHOT_FIELDS = tuple(f.name for f in fields(SettingsSnapshot))
+
+
+def _current_api_key(settings: Union[ChiselSettings, SettingsSnapshot]) -> Optional[str]:
+    """API key for the settings' current provider."""
+    if settings.api_provider == APIProvider.GOOGLE:
+        return settings.google_api_key or settings.api_key  # Fallback to legacy
+    elif settings.api_provider == APIProvider.OPENROUTER:
+        return settings.openrouter_api_key
+    return None
+
+
+def _current_model(settings: Union[ChiselSettings, SettingsSnapshot]) -> str:
+    """Model for the settings' current provider."""
+    if settings.api_provider == APIProvider.GOOGLE:
+        return settings.google_model or settings.ai_model or "gemini-2.5-pro"
+    elif settings.api_provider == APIProvider.OPENROUTER:
+        return settings.openrouter_model
+    return "gemini-2.5-pro"
+
+
+class _SettingsWriter:
+    """Background thread that persists the most recently saved settings."""
+    
+    def __init__(self):
+        # Holds at most one pending save; a newer one replaces it
+        self._queue: "queue.Queue[tuple[SettingsManager, ChiselSettings, list[Future[bool]]]]" = queue.Queue(maxsize=1)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, manager: "SettingsManager", settings: ChiselSettings) -> "Future[bool]":
+        """
+        Queue settings for writing, dropping any save not yet started.
+        
+        Args:
+            manager: Manager whose file and keyring to write
+            settings: Settings to write
+            
+        Returns:
+            Future[bool]: Resolves to the result of the write that persists
+            these settings, or of the newer save that superseded them
+        """
+        future: "Future[bool]" = Future()
+        futures = [future]
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+                self._thread.start()
+            
+            try:
+                _, _, superseded = self._queue.get_nowait()
+                self._queue.task_done()
+                futures.extend(superseded)
+                logger.debug("Superseded a pending settings save")
+            except queue.Empty:
+                pass
+            self._queue.put_nowait((manager, settings, futures))
+        return future
+    
+    def flush(self) -> None:
+        """Block until every queued save has been written."""
+        self._queue.join()
+    
+    def _run(self) -> None:
+        while True:
+            manager, settings, futures = self._queue.get()
+            success = False
+            try:
+                success = manager.save_settings_sync(settings)
+            finally:
+                for future in futures:
+                    future.set_result(success)
+                self._queue.task_done()
+
+
+# One writer for every SettingsManager, since they all share one file
+_writer = _SettingsWriter()
+atexit.register(_writer.flush)
+
+
+class _SecretCache:
+    """
+    Process-wide cache of the API keys held in the OS keyring.
+    
+    Each keyring lookup is an IPC round trip to the secret store, so values
+    are read once, on a background thread, and shared by every
+    SettingsManager; a key saved through one manager is seen by all.
+    """
+    
+    def __init__(self, service: str):
+        self._service = service
+        self._values: dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._prefetch_started = False
+    
+    def start_prefetch(self) -> None:
+        """Start reading all API keys in the background, once per process."""
+        with self._lock:
+            if self._prefetch_started:
+                return
+            self._prefetch_started = True
+        threading.Thread(target=self._prefetch, name="keyring-prefetch", daemon=True).start()
+    
+    def _prefetch(self) -> None:
+        for key in _SECRET_KEYS:
+            try:
+                self.get(key)
+            except Exception as e:
+                logger.debug(f"Keyring prefetch of {key} failed: {e}")
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a keyring value, reading the keyring only on first use.
+        
+        Args:
+            key: Keyring entry name
+            
+        Returns:
+            Optional[str]: Stored value, or None if not set
+        """
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = _keyring().get_password(self._service, key)
+            return self._values[key]
+    
+    def set(self, key: str, value: str) -> bool:
+        """
+        Store a keyring value unless the keyring already holds it.
+        
+        Args:
+            key: Keyring entry name
+            value: Value to store
+            
+        Returns:
+            bool: True if the keyring was written
+        """
+        with self._lock:
+            if key in self._values and self._values[key] == value:
+                return False
+            _keyring().set_password(self._service, key, value)
+            self._values[key] = value
+            return True
+    
+    def delete(self, key: str) -> None:
+        """Remove a keyring value."""
+        with self._lock:
+            _keyring().delete_password(self._service, key)
+            self._values[key] = None
+
+
+_secrets = _SecretCache("Chisel")
+
+
 class SettingsManager:
     """Manages application settings persistence and secure storage."""
     
@@ -133,16 +352,48 @@ class SettingsManager:
         # Ensure config directory exists
         self.config_dir.mkdir(exist_ok=True)
         
+        # Last loaded or saved settings, valid while the config file's mtime
+        # is unchanged; spares repeat file parses and keyring lookups
+        self._cached_settings: Optional[ChiselSettings] = None
+        self._cached_mtime: Optional[float] = None
+        self._cache_lock = threading.Lock()
+        
+        # Contents of the config file as last read or written, so saves that
+        # change nothing skip the disk
+        self._last_written_bytes: Optional[bytes] = None
+        
+        # API keys are read from the keyring once per process, in the background
+        _secrets.start_prefetch()
+    
+    def _config_mtime(self) -> float:
+        """Modification time of the config file, or 0.0 if it is missing."""
+        try:
+            return self.config_file.stat().st_mtime
+        except OSError:
+            return 0.0
+    
+    def _update_cache(self, settings: Optional[ChiselSettings]) -> None:
+        """Remember settings as matching the config file's current mtime."""
+        with self._cache_lock:
+            self._cached_settings = settings.model_copy() if settings else None
+            self._cached_mtime = self._config_mtime() if settings else None
+    
     def load_settings(self) -> ChiselSettings:
         """Load settings from file and keyring."""
+        with self._cache_lock:
+            if self._cached_settings is not None and self._cached_mtime == self._config_mtime():
+                # Callers may modify what they get, so hand out a copy
+                return self._cached_settings.model_copy()
+        
         settings = ChiselSettings()
         
         # Load from config file
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                settings = ChiselSettings(**data)
+                raw = self.config_file.read_bytes()
+                data = orjson.loads(raw)
+                self._last_written_bytes = raw
+                settings = self._settings_from_file_data(data)
                 logger.info("Settings loaded from config file")
             except Exception as e:
                 logger.error(f"Error loading settings from file: {e}")
@@ -152,20 +403,20 @@ class SettingsManager:
         # Load API keys from secure storage
         try:
             # Load Google API key (check both new and legacy keys)
-            google_key = keyring.get_password(self.app_name, "google_api_key")
+            google_key = _secrets.get("google_api_key")
             if google_key:
                 settings.google_api_key = google_key
                 logger.info("Google API key loaded from keyring")
             else:
                 # Fallback to legacy api_key for backward compatibility
-                legacy_key = keyring.get_password(self.app_name, "api_key")
+                legacy_key = _secrets.get("api_key")
                 if legacy_key:
                     settings.google_api_key = legacy_key
                     settings.api_key = legacy_key  # Keep for compatibility
                     logger.info("Legacy API key loaded from keyring")
             
             # Load OpenRouter API key
-            openrouter_key = keyring.get_password(self.app_name, "openrouter_api_key")
+            openrouter_key = _secrets.get("openrouter_api_key")
             if openrouter_key:
                 settings.openrouter_api_key = openrouter_key
                 logger.info("OpenRouter API key loaded from keyring")
@@ -173,35 +424,68 @@ class SettingsManager:
         except Exception as e:
             logger.error(f"Error loading API keys from keyring: {e}")
         
+        self._update_cache(settings)
         return settings
     
-    def save_settings(self, settings: ChiselSettings) -> bool:
-        """Save settings to file and keyring."""
+    def save_settings(self, settings: ChiselSettings) -> "Future[bool]":
+        """
+        Save settings to file and keyring in the background.
+        
+        The settings take effect for load_settings() immediately; the disk
+        and keyring writes happen on the settings writer thread, and rapid
+        successive saves collapse into the latest one.
+        
+        Args:
+            settings: Settings to save
+            
+        Returns:
+            Future[bool]: Resolves on the writer thread to True if both the
+            keyring and the config file were written
+        """
+        settings = settings.model_copy()
+        # Cached against the pre-write mtime; the writer re-caches after the
+        # write, and a load in between rereads the already-written file
+        self._update_cache(settings)
+        return _writer.submit(self, settings)
+    
+    def flush(self) -> None:
+        """Wait for queued saves to reach disk and keyring."""
+        _writer.flush()
+    
+    def save_settings_sync(self, settings: ChiselSettings) -> bool:
+        """
+        Save settings to file and keyring, blocking until done.
+        
+        Call flush() first if save_settings() may have a write queued.
+        
+        Args:
+            settings: Settings to save
+            
+        Returns:
+            bool: True if both the keyring and the config file were written
+        """
         try:
             # Save API keys securely
             try:
                 # Save Google API key
-                if settings.google_api_key:
-                    keyring.set_password(self.app_name, "google_api_key", settings.google_api_key)
+                if settings.google_api_key and _secrets.set("google_api_key", settings.google_api_key):
                     logger.info("Google API key saved to keyring")
                 
                 # Save OpenRouter API key
-                if settings.openrouter_api_key:
-                    keyring.set_password(self.app_name, "openrouter_api_key", settings.openrouter_api_key)
+                if settings.openrouter_api_key and _secrets.set("openrouter_api_key", settings.openrouter_api_key):
                     logger.info("OpenRouter API key saved to keyring")
                     
                 # Save legacy api_key for backward compatibility
                 if settings.api_key:
-                    keyring.set_password(self.app_name, "api_key", settings.api_key)
+                    _secrets.set("api_key", settings.api_key)
                     
             except Exception as e:
                 logger.error(f"Error saving API keys to keyring: {e}")
                 return False
             
             # Save other settings to file (exclude all API keys)
-            settings_dict = settings.dict(exclude={"api_key", "google_api_key", "openrouter_api_key"})
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(settings_dict, f, indent=2, ensure_ascii=False)
+            self._write_config_file(settings)
+            self._update_cache(settings)
             
             logger.info("Settings saved successfully")
             return True
@@ -210,10 +494,57 @@ class SettingsManager:
             logger.error(f"Error saving settings: {e}")
             return False
     
+    def _settings_from_file_data(self, data: dict) -> ChiselSettings:
+        """
+        Build settings from parsed config file data.
+        
+        Files stamped with the current schema version were written by
+        save_settings() and skip validation; others are validated and the
+        file is rewritten with the current stamp.
+        
+        Args:
+            data: Parsed settings.json contents
+            
+        Returns:
+            ChiselSettings: Settings from the file
+        """
+        if data.pop(_SCHEMA_KEY, None) == SCHEMA_VERSION:
+            try:
+                # model_construct doesn't coerce, so restore the enum by hand
+                values = dict(data)
+                if "api_provider" in values:
+                    values["api_provider"] = APIProvider(values["api_provider"])
+                return ChiselSettings.model_construct(**values)
+            except ValueError as e:
+                logger.warning(f"Stamped config file failed trusted load, validating: {e}")
+        
+        settings = ChiselSettings.model_validate(data)
+        try:
+            self._write_config_file(settings)
+            logger.info(f"Config file migrated to schema version {SCHEMA_VERSION}")
+        except OSError as e:
+            logger.warning(f"Could not rewrite config file: {e}")
+        return settings
+    
+    def _write_config_file(self, settings: ChiselSettings) -> None:
+        """Write settings (without API keys) to the config file."""
+        settings_dict = settings.model_dump(mode='json', exclude=_SECRET_FIELDS, exclude_none=True)
+        settings_dict[_SCHEMA_KEY] = SCHEMA_VERSION
+        new_bytes = orjson.dumps(settings_dict, option=orjson.OPT_INDENT_2)
+        if new_bytes == self._last_written_bytes and self.config_file.exists():
+            return
+        
+        # Write a sibling file and swap it in, so a crash mid-write can't
+        # leave a truncated config behind
+        tmp_file = self.config_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(new_bytes)
+        os.replace(tmp_file, self.config_file)
+        self._last_written_bytes = new_bytes
+    
     def delete_api_key(self) -> bool:
         """Delete API key from secure storage."""
         try:
-            keyring.delete_password(self.app_name, "api_key")
+            _secrets.delete("api_key")
             logger.info("API key deleted from keyring")
             return True
         except Exception as e:
@@ -223,6 +554,9 @@ class SettingsManager:
     def reset_settings(self) -> bool:
         """Reset settings to defaults."""
         try:
+            # Don't let a queued save recreate the file afterwards
+            self.flush()
+            
             # Delete config file
             if self.config_file.exists():
                 self.config_file.unlink()
@@ -230,6 +564,9 @@ class SettingsManager:
             # Delete API key
             self.delete_api_key()
             
+            self._update_cache(None)
+            self._last_written_bytes = None
+            
             logger.info("Settings reset to defaults")
             return True
             
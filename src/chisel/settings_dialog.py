@@ -11,51 +11,40 @@ from PyQt6.QtWidgets import (
     QPushButton, QLabel, QTextEdit, QMessageBox, QTabWidget,
     QWidget, QSlider, QFrame, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
-from PyQt6.QtGui import QFont, QPixmap
-from typing import Optional, List
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QFont, QPixmap, QShowEvent
+from typing import Optional, List, Callable, Dict, Tuple
+import time
 import asyncio
+from functools import partial
 from loguru import logger
 
 from .settings import ChiselSettings, SettingsManager, APIProvider
-from .ai_client import GeminiClient, OpenRouterClient, ModelInfo, create_ai_client
-from .styles import apply_main_stylesheet
+from .ai_client import ModelInfo, fetch_provider_models, get_fallback_models, test_provider_key
+from . import model_cache
 
 
-class ModelFetchWorker(QThread):
-    """Worker thread to fetch models from any API provider."""
+# Prompt preset buttons: (label, prompt)
+_PRESETS = (
+    ("Professional", "Rephrase this text to be more professional and clear:"),
+    ("Casual", "Rephrase this text to be more casual and friendly:"),
+    ("Concise", "Make this text more concise while keeping the meaning:"),
+)
 
-    models_fetched = pyqtSignal(list)  # List[ModelInfo]
-    fetch_error = pyqtSignal(str)
 
-    def __init__(self, api_provider: APIProvider, api_key: str):
-        super().__init__()
-        self.api_provider = api_provider
-        self.api_key = api_key
+# Per-provider UI text: (API group title, key placeholder, settings key attribute)
+_PROVIDER_META = {
+    APIProvider.GOOGLE: ("Google AI Configuration", "Enter your Google AI API key", "google_api_key"),
+    APIProvider.OPENROUTER: ("OpenRouter Configuration", "Enter your OpenRouter API key", "openrouter_api_key"),
+}
 
-    def run(self):
-        """Fetch models in background thread."""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+# How long a passed connection test is reused for the same provider and key
+_TEST_RESULT_TTL = 60  # seconds
 
-            if self.api_provider == APIProvider.GOOGLE:
-                models = loop.run_until_complete(
-                    GeminiClient.fetch_models_static(self.api_key, timeout=10)
-                )
-            elif self.api_provider == APIProvider.OPENROUTER:
-                # Create temporary client to fetch models
-                client = OpenRouterClient(self.api_key, timeout=10)
-                models = loop.run_until_complete(client.fetch_available_models())
-            else:
-                raise ValueError(f"Unsupported provider: {self.api_provider}")
 
-            self.models_fetched.emit(models)
-
-        except Exception as e:
-            self.fetch_error.emit(str(e))
-        finally:
-            loop.close()
+def _fallback_models(provider: APIProvider) -> List[ModelInfo]:
+    """Built-in model list for a provider."""
+    return get_fallback_models(provider.value)
 
 
 class SettingsDialog(QDialog):
@@ -63,27 +52,39 @@ class SettingsDialog(QDialog):
 
     settings_changed = pyqtSignal(ChiselSettings)
 
-    def __init__(self, current_settings: ChiselSettings, parent=None):
+    def __init__(self, current_settings: ChiselSettings, settings_manager: Optional[SettingsManager] = None, parent=None):
         super().__init__(parent)
         self.current_settings = current_settings
-        self.settings_manager = SettingsManager()
+        # Share the application's manager so its caches see what is saved here
+        self.settings_manager = settings_manager or SettingsManager()
         self.available_models: List[ModelInfo] = []
-        self.model_fetch_worker: Optional[ModelFetchWorker] = None
+        self._fetch_task: Optional[asyncio.Task] = None
+        self._test_task: Optional[asyncio.Task] = None
+        # (provider:key hash, time.monotonic()) of the last passed connection test
+        self._last_test_ok: Optional[Tuple[str, float]] = None
+        self._settings_loaded = False
+
+        # Coalesces API key keystrokes so only the settled key is fetched
+        self._key_debounce = QTimer(self)
+        self._key_debounce.setSingleShot(True)
+        self._key_debounce.setInterval(400)
+        self._key_debounce.timeout.connect(self._on_api_key_settled)
+
+        # Coalesces slider drags to at most one label update per frame
+        self._slider_label_timer = QTimer(self)
+        self._slider_label_timer.setSingleShot(True)
+        self._slider_label_timer.setInterval(16)
+        self._slider_label_timer.timeout.connect(self._update_slider_labels)
 
         self.setWindowTitle("Chisel Settings")
         self.setModal(True)
         self.resize(580, 700)
         self.setObjectName("SettingsDialog")
-        
-        # Apply external stylesheet
-        apply_main_stylesheet(self)
+        # Let the stylesheet paint the background directly
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
+        # Widgets are filled in on first show; see showEvent()
         self.setup_ui()
-        self.load_current_settings()
-
-        # Start fetching models if API key is available
-        if current_settings.current_api_key:
-            self.fetch_models()
 
         logger.info("Settings dialog initialized")
 
@@ -120,11 +121,16 @@ class SettingsDialog(QDialog):
         # Tab widget with modern styling
         self.tab_widget = QTabWidget()
         self.tab_widget.setObjectName("SettingsTabWidget")
+        self.tab_widget.setUsesScrollButtons(False)  # Three tabs always fit
 
-        # Create tabs
+        # Create tabs; the Behavior and Advanced tabs are built the first
+        # time they are selected, most visits only touch the AI tab
         self.create_api_tab()
-        self.create_behavior_tab()
-        self.create_advanced_tab()
+        self._tab_builders: Dict[int, Tuple[Callable[[], QWidget], Callable[[], None]]] = {
+            self.tab_widget.addTab(QWidget(), "Behavior"): (self.create_behavior_tab, self._load_behavior_settings),
+            self.tab_widget.addTab(QWidget(), "Advanced"): (self.create_advanced_tab, self._load_advanced_settings),
+        }
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         content_layout.addWidget(self.tab_widget)
 
@@ -180,7 +186,7 @@ class SettingsDialog(QDialog):
         self.provider_combo.addItem("OpenRouter", APIProvider.OPENROUTER.value)
         self.provider_combo.currentTextChanged.connect(self.on_provider_changed)
         self.style_input_widget(self.provider_combo)
-        self.add_form_row(provider_layout, "Provider:", self.provider_combo)
+        provider_layout.addRow("Provider:", self.provider_combo)
 
         layout.addWidget(provider_group)
 
@@ -195,13 +201,13 @@ class SettingsDialog(QDialog):
         self.api_key_edit.setPlaceholderText("Enter your API key")
         self.api_key_edit.textChanged.connect(self.on_api_key_changed)
         self.style_input_widget(self.api_key_edit)
-        self.add_form_row(self.api_layout, "API Key:", self.api_key_edit)
+        self.api_layout.addRow("API Key:", self.api_key_edit)
 
         # Show/Hide API Key
         self.show_key_checkbox = QCheckBox("Show API key")
         self.show_key_checkbox.toggled.connect(self.toggle_api_key_visibility)
         self.style_checkbox(self.show_key_checkbox)
-        self.add_form_row(self.api_layout, "", self.show_key_checkbox)
+        self.api_layout.addRow(self.show_key_checkbox)
 
         # AI Model Selection
         model_layout = QHBoxLayout()
@@ -224,7 +230,7 @@ class SettingsDialog(QDialog):
         self.model_loading_label.hide()
         model_layout.addWidget(self.model_loading_label)
 
-        self.add_form_row(self.api_layout, "AI Model:", model_layout)
+        self.api_layout.addRow("AI Model:", model_layout)
 
         layout.addWidget(self.api_group)
 
@@ -245,13 +251,15 @@ class SettingsDialog(QDialog):
         self.style_slider(self.temperature_slider)
 
         self.temperature_label = QLabel("0.70")
-        self.temperature_label.setMinimumWidth(40)
+        # Fixed size so changing the value doesn't relayout the form
+        self.temperature_label.setFixedWidth(40)
+        self.temperature_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         self.temperature_label.setObjectName("SliderLabel")
 
         temp_layout.addWidget(self.temperature_slider)
         temp_layout.addWidget(self.temperature_label)
 
-        self.add_form_row(params_layout, "Temperature:", temp_layout)
+        params_layout.addRow("Temperature:", temp_layout)
 
         # Top-P
         top_p_layout = QHBoxLayout()
@@ -262,13 +270,14 @@ class SettingsDialog(QDialog):
         self.style_slider(self.top_p_slider)
 
         self.top_p_label = QLabel("0.80")
-        self.top_p_label.setMinimumWidth(40)
+        self.top_p_label.setFixedWidth(40)
+        self.top_p_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         self.top_p_label.setObjectName("SliderLabel")
 
         top_p_layout.addWidget(self.top_p_slider)
         top_p_layout.addWidget(self.top_p_label)
 
-        self.add_form_row(params_layout, "Top-P:", top_p_layout)
+        params_layout.addRow("Top-P:", top_p_layout)
 
         # Help text
         help_label = QLabel(
@@ -277,7 +286,7 @@ class SettingsDialog(QDialog):
         )
         help_label.setWordWrap(True)
         help_label.setObjectName("HelpLabel")
-        self.add_form_row(params_layout, "", help_label)
+        params_layout.addRow(help_label)
 
         layout.addWidget(params_group)
 
@@ -288,6 +297,7 @@ class SettingsDialog(QDialog):
 
         self.prompt_edit = QTextEdit()
         self.prompt_edit.setMaximumHeight(100)
+        self.prompt_edit.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)  # Text wraps
         self.prompt_edit.setPlaceholderText("Enter the default prompt for AI processing...")
         self.style_input_widget(self.prompt_edit)
         prompt_layout.addWidget(self.prompt_edit)
@@ -296,13 +306,9 @@ class SettingsDialog(QDialog):
         preset_layout = QHBoxLayout()
         preset_layout.addWidget(QLabel("Presets:"))
 
-        for text, prompt in [
-            ("Professional", "Rephrase this text to be more professional and clear:"),
-            ("Casual", "Rephrase this text to be more casual and friendly:"),
-            ("Concise", "Make this text more concise while keeping the meaning:")
-        ]:
+        for text, prompt in _PRESETS:
             btn = QPushButton(text)
-            btn.clicked.connect(lambda checked, p=prompt: self.set_prompt_preset(p))
+            btn.clicked.connect(partial(self.set_prompt_preset, prompt))
             btn.setObjectName("PresetButton")
             preset_layout.addWidget(btn)
 
@@ -314,7 +320,46 @@ class SettingsDialog(QDialog):
 
         self.tab_widget.addTab(tab, "AI Configuration")
 
-    def create_behavior_tab(self) -> None:
+    def showEvent(self, event: QShowEvent) -> None:
+        """Load the current settings just before the dialog first appears."""
+        if not self._settings_loaded:
+            self._settings_loaded = True
+
+            # Populate with painting off; loading the provider also starts
+            # the model fetch when there is an API key
+            self.setUpdatesEnabled(False)
+            try:
+                self.load_current_settings()
+            finally:
+                self.setUpdatesEnabled(True)
+
+        super().showEvent(event)
+
+    def _on_tab_changed(self, index: int) -> None:
+        """Build a deferred tab the first time it is selected."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+
+        create_tab, load_settings = builder
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+
+        # Swapping the page moves the current index; don't re-enter
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, create_tab(), title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+        load_settings()
+
+    def _tab_built(self, create_tab: Callable[[], QWidget]) -> bool:
+        """Whether a deferred tab has been built yet."""
+        return all(builder[0] != create_tab for builder in self._tab_builders.values())
+
+    def create_behavior_tab(self) -> QWidget:
         """Create the behavior configuration tab."""
         tab = QWidget()
         tab.setObjectName("BehaviorTab")
@@ -330,7 +375,7 @@ class SettingsDialog(QDialog):
         self.hotkey_edit = QLineEdit()
         self.hotkey_edit.setPlaceholderText("e.g., <ctrl>+<shift>+r")
         self.style_input_widget(self.hotkey_edit)
-        self.add_form_row(hotkey_layout, "Hotkey:", self.hotkey_edit)
+        hotkey_layout.addRow("Hotkey:", self.hotkey_edit)
 
         hotkey_help = QLabel(
             "Use pynput format: <ctrl>, <alt>, <shift>, <cmd> (macOS)\n"
@@ -338,7 +383,7 @@ class SettingsDialog(QDialog):
         )
         hotkey_help.setWordWrap(True)
         hotkey_help.setObjectName("HotkeyHelp")
-        self.add_form_row(hotkey_layout, "", hotkey_help)
+        hotkey_layout.addRow(hotkey_help)
 
         layout.addWidget(hotkey_group)
 
@@ -349,7 +394,7 @@ class SettingsDialog(QDialog):
 
         self.notifications_checkbox = QCheckBox("Show system notifications")
         self.style_checkbox(self.notifications_checkbox)
-        self.add_form_row(notify_layout, "", self.notifications_checkbox)
+        notify_layout.addRow(self.notifications_checkbox)
 
         layout.addWidget(notify_group)
 
@@ -360,14 +405,14 @@ class SettingsDialog(QDialog):
 
         self.auto_start_checkbox = QCheckBox("Start with Windows")
         self.style_checkbox(self.auto_start_checkbox)
-        self.add_form_row(startup_layout, "", self.auto_start_checkbox)
+        startup_layout.addRow(self.auto_start_checkbox)
 
         layout.addWidget(startup_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "Behavior")
+        return tab
 
-    def create_advanced_tab(self) -> None:
+    def create_advanced_tab(self) -> QWidget:
         """Create the advanced configuration tab."""
         tab = QWidget()
         tab.setObjectName("AdvancedTab")
@@ -385,14 +430,22 @@ class SettingsDialog(QDialog):
         self.timeout_spin.setValue(30)
         self.timeout_spin.setSuffix(" seconds")
         self.style_input_widget(self.timeout_spin)
-        self.add_form_row(perf_layout, "API Timeout:", self.timeout_spin)
+        perf_layout.addRow("API Timeout:", self.timeout_spin)
 
         self.max_length_spin = QSpinBox()
         self.max_length_spin.setRange(100, 50000)
         self.max_length_spin.setValue(5000)
         self.max_length_spin.setSuffix(" characters")
         self.style_input_widget(self.max_length_spin)
-        self.add_form_row(perf_layout, "Max Text Length:", self.max_length_spin)
+        perf_layout.addRow("Max Text Length:", self.max_length_spin)
+
+        self.cache_responses_checkbox = QCheckBox("Cache AI responses on disk")
+        self.cache_responses_checkbox.setToolTip(
+            "Answer repeated requests without calling the API. "
+            "Turning this off deletes the cached responses."
+        )
+        self.style_checkbox(self.cache_responses_checkbox)
+        perf_layout.addRow(self.cache_responses_checkbox)
 
         layout.addWidget(perf_group)
 
@@ -409,7 +462,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(debug_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "Advanced")
+        return tab
 
     def create_styled_group(self, title: str) -> QGroupBox:
         """Create a styled group box."""
@@ -417,15 +470,6 @@ class SettingsDialog(QDialog):
         group.setObjectName("SettingsGroup")
         return group
 
-    def add_form_row(self, layout: QFormLayout, label_text: str, widget) -> None:
-        """Add a properly styled form row with label."""
-        if label_text:
-            label = QLabel(label_text)
-            label.setObjectName("FormLabel")
-            layout.addRow(label, widget)
-        else:
-            layout.addRow(widget)
-
     def style_input_widget(self, widget) -> None:
         """Apply modern styling to input widgets."""
         widget.setObjectName("InputWidget")
@@ -449,14 +493,17 @@ class SettingsDialog(QDialog):
             self.api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
 
     def update_temperature_label(self, value: int) -> None:
-        """Update temperature label."""
-        temp = value / 100.0
-        self.temperature_label.setText(f"{temp:.2f}")
+        """Schedule a temperature label update."""
+        self._slider_label_timer.start()
 
     def update_top_p_label(self, value: int) -> None:
-        """Update top-p label."""
-        top_p = value / 100.0
-        self.top_p_label.setText(f"{top_p:.2f}")
+        """Schedule a top-p label update."""
+        self._slider_label_timer.start()
+
+    def _update_slider_labels(self) -> None:
+        """Show the sliders' settled values."""
+        self.temperature_label.setText(f"{self.temperature_slider.value() / 100:.2f}")
+        self.top_p_label.setText(f"{self.top_p_slider.value() / 100:.2f}")
 
     def set_prompt_preset(self, prompt: str) -> None:
         """Set a prompt preset."""
@@ -487,14 +534,23 @@ class SettingsDialog(QDialog):
         self.temperature_slider.setValue(int(self.current_settings.temperature * 100))
         self.top_p_slider.setValue(int(self.current_settings.top_p * 100))
 
-        # Behavior
+        # Deferred tabs load their values when built
+        if self._tab_built(self.create_behavior_tab):
+            self._load_behavior_settings()
+        if self._tab_built(self.create_advanced_tab):
+            self._load_advanced_settings()
+
+    def _load_behavior_settings(self) -> None:
+        """Load current settings into the Behavior tab."""
         self.hotkey_edit.setText(self.current_settings.global_hotkey)
         self.notifications_checkbox.setChecked(self.current_settings.show_notifications)
         self.auto_start_checkbox.setChecked(self.current_settings.auto_start)
 
-        # Advanced
+    def _load_advanced_settings(self) -> None:
+        """Load current settings into the Advanced tab."""
         self.timeout_spin.setValue(self.current_settings.api_timeout)
         self.max_length_spin.setValue(self.current_settings.max_text_length)
+        self.cache_responses_checkbox.setChecked(self.current_settings.cache_responses)
 
     def save_settings(self) -> None:
         """Save settings and close dialog."""
@@ -519,17 +575,12 @@ class SettingsDialog(QDialog):
                 )
                 return
 
-            # Save settings
-            if self.settings_manager.save_settings(new_settings):
-                self.settings_changed.emit(new_settings)
-                self.accept()
-                logger.info("Settings saved successfully")
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Save Error",
-                    "Failed to save settings. Please try again."
-                )
+            # Write on the settings writer thread and close once it reports
+            # back, so keyring IO never blocks the UI and failures still
+            # reach the user
+            self.save_button.setEnabled(False)
+            saved = asyncio.wrap_future(self.settings_manager.save_settings(new_settings))
+            saved.add_done_callback(partial(self._on_save_done, new_settings))
 
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
@@ -539,8 +590,31 @@ class SettingsDialog(QDialog):
                 f"Error saving settings: {str(e)}"
             )
 
+    def _on_save_done(self, new_settings: ChiselSettings, future: asyncio.Future) -> None:
+        """Close the dialog after a successful save, or report the failure."""
+        if future.cancelled():
+            return
+
+        if not future.exception() and future.result():
+            self.settings_changed.emit(new_settings)
+            self.accept()
+            logger.info("Settings saved successfully")
+            return
+
+        self.save_button.setEnabled(True)
+        QMessageBox.critical(
+            self,
+            "Save Error",
+            "Failed to save settings. Please try again."
+        )
+
     def get_settings_from_ui(self) -> ChiselSettings:
         """Get settings from UI controls."""
+        # Tabs that were never opened keep their current values
+        behavior_built = self._tab_built(self.create_behavior_tab)
+        advanced_built = self._tab_built(self.create_advanced_tab)
+        current = self.current_settings
+
         # Start with current settings to preserve provider-specific data
         new_settings = ChiselSettings(
             # Provider configuration
@@ -560,11 +634,12 @@ class SettingsDialog(QDialog):
             current_prompt=self.prompt_edit.toPlainText().strip(),
             temperature=self.temperature_slider.value() / 100.0,
             top_p=self.top_p_slider.value() / 100.0,
-            global_hotkey=self.hotkey_edit.text().strip(),
-            show_notifications=self.notifications_checkbox.isChecked(),
-            auto_start=self.auto_start_checkbox.isChecked(),
-            api_timeout=self.timeout_spin.value(),
-            max_text_length=self.max_length_spin.value()
+            global_hotkey=self.hotkey_edit.text().strip() if behavior_built else current.global_hotkey,
+            show_notifications=self.notifications_checkbox.isChecked() if behavior_built else current.show_notifications,
+            auto_start=self.auto_start_checkbox.isChecked() if behavior_built else current.auto_start,
+            api_timeout=self.timeout_spin.value() if advanced_built else current.api_timeout,
+            max_text_length=self.max_length_spin.value() if advanced_built else current.max_text_length,
+            cache_responses=self.cache_responses_checkbox.isChecked() if advanced_built else current.cache_responses
         )
 
         # Update current provider's API key and model
@@ -589,13 +664,71 @@ class SettingsDialog(QDialog):
             )
             return
 
-        # TODO: Implement actual API test
-        QMessageBox.information(
-            self,
-            "Test Connection",
-            "API connection test not yet implemented.\n"
-            "This will test your API key in a future version."
-        )
+        if self._test_task and not self._test_task.done():
+            return
+
+        provider = self.get_current_provider()
+        test_key = f"{provider.value}:{model_cache.hash_api_key(api_key)}"
+
+        # A key that passed moments ago doesn't need another round trip
+        if (self._last_test_ok and self._last_test_ok[0] == test_key
+                and time.monotonic() - self._last_test_ok[1] < _TEST_RESULT_TTL):
+            self._show_test_result(True)
+            return
+
+        self.test_button.setEnabled(False)
+        self.test_button.setText("Testing...")
+
+        self._test_task = asyncio.ensure_future(self._test_connection_async(provider, api_key))
+        self._test_task.add_done_callback(partial(self._on_test_done, test_key))
+
+    async def _test_connection_async(self, provider: APIProvider, api_key: str) -> bool:
+        """
+        Test the API key through the shared client the model fetches use.
+
+        Args:
+            provider: Provider to test
+            api_key: API key for the provider
+
+        Returns:
+            bool: True if the provider accepted the key
+        """
+        return await test_provider_key(provider.value, api_key, timeout=10)
+
+    def _on_test_done(self, test_key: str, task: asyncio.Task) -> None:
+        """Show the outcome of a connection test."""
+        if task.cancelled():
+            return
+
+        self.test_button.setEnabled(True)
+        self.test_button.setText("Test Connection")
+
+        error = task.exception()
+        if error is not None:
+            logger.error(f"Connection test failed: {error}")
+            success = False
+        else:
+            success = task.result()
+
+        if success:
+            self._last_test_ok = (test_key, time.monotonic())
+        self._show_test_result(success)
+
+    def _show_test_result(self, success: bool) -> None:
+        """Report a connection test result to the user."""
+        if success:
+            QMessageBox.information(
+                self,
+                "Test Connection",
+                "Connection successful. Your API key is working."
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Test Connection",
+                "Connection failed.\n"
+                "Please check your API key and network connection."
+            )
 
     def reset_settings(self) -> None:
         """Reset all settings to defaults."""
@@ -619,16 +752,7 @@ class SettingsDialog(QDialog):
 
     def populate_fallback_models(self) -> None:
         """Populate combo box with fallback models for current provider."""
-        provider = self.get_current_provider()
-        if provider == APIProvider.GOOGLE:
-            fallback_models = GeminiClient._get_fallback_models_static()
-        elif provider == APIProvider.OPENROUTER:
-            temp_client = OpenRouterClient("dummy", 10)
-            fallback_models = temp_client._get_fallback_models()
-        else:
-            fallback_models = []
-
-        self.available_models = fallback_models
+        self.available_models = _fallback_models(self.get_current_provider())
         self.update_model_combo()
 
     def get_current_provider(self) -> APIProvider:
@@ -644,18 +768,14 @@ class SettingsDialog(QDialog):
         logger.info(f"Provider changed to: {provider.value}")
 
         # Update API key placeholder and group title
-        if provider == APIProvider.GOOGLE:
-            self.api_group.setTitle("Google AI Configuration")
-            self.api_key_edit.setPlaceholderText("Enter your Google AI API key")
-        elif provider == APIProvider.OPENROUTER:
-            self.api_group.setTitle("OpenRouter Configuration")
-            self.api_key_edit.setPlaceholderText("Enter your OpenRouter API key")
+        title, placeholder, key_attr = _PROVIDER_META[provider]
+        self.api_group.setTitle(title)
+        self.api_key_edit.setPlaceholderText(placeholder)
 
         # Load provider-specific API key if available
-        if provider == APIProvider.GOOGLE and self.current_settings.google_api_key:
-            self.api_key_edit.setText(self.current_settings.google_api_key)
-        elif provider == APIProvider.OPENROUTER and self.current_settings.openrouter_api_key:
-            self.api_key_edit.setText(self.current_settings.openrouter_api_key)
+        api_key = getattr(self.current_settings, key_attr)
+        if api_key:
+            self.api_key_edit.setText(api_key)
         else:
             self.api_key_edit.clear()
 
@@ -667,7 +787,9 @@ class SettingsDialog(QDialog):
         has_key = bool(self.api_key_edit.text().strip())
         self.refresh_models_btn.setEnabled(has_key)
 
-        # Auto-fetch models if we have an API key
+        # Auto-fetch models if we have an API key; the key was just set
+        # programmatically, so the keystroke debounce has nothing to add
+        self._key_debounce.stop()
         if has_key:
             self.fetch_models()
 
@@ -677,54 +799,121 @@ class SettingsDialog(QDialog):
         if current_selection is None and self.model_combo.count() > 0:
             current_selection = self.model_combo.currentText()
 
-        self.model_combo.clear()
-
-        for model in self.available_models:
-            display_text = f"{model.display_name or model.name}"
-            if model.description:
-                display_text += f" - {model.description[:50]}..."
+        # Rebuild silently; OpenRouter lists hundreds of models and the
+        # combo would otherwise signal an index change for each one
+        self.model_combo.blockSignals(True)
+        try:
+            self.model_combo.clear()
+
+            for model in self.available_models:
+                display_text = f"{model.display_name or model.name}"
+                if model.description:
+                    display_text += f" - {model.description[:50]}..."
+
+                self.model_combo.addItem(display_text, model.name)
+
+            # Restore previous selection if available
+            if current_selection:
+                index = self.model_combo.findData(current_selection)
+                if index < 0:
+                    # If not found, add it as a custom entry
+                    self.model_combo.addItem(current_selection, current_selection)
+                    index = self.model_combo.count() - 1
+                self.model_combo.setCurrentIndex(index)
+        finally:
+            self.model_combo.blockSignals(False)
 
-            self.model_combo.addItem(display_text, model.name)
+    def fetch_models(self, force: bool = False) -> None:
+        """
+        Show models for the current provider, fetching them if needed.
 
-        # Restore previous selection if available
-        if current_selection:
-            for i in range(self.model_combo.count()):
-                if self.model_combo.itemData(i) == current_selection:
-                    self.model_combo.setCurrentIndex(i)
-                    return
+        Models cached within the TTL are shown without a request; stale
+        cached models are shown while a refresh runs.
 
-            # If not found, add it as a custom entry
-            self.model_combo.addItem(current_selection, current_selection)
-            self.model_combo.setCurrentIndex(self.model_combo.count() - 1)
+        Args:
+            force: Fetch from the API even if the cache is fresh
+        """
+        # Supersede any fetch still running for a previous provider or key,
+        # including when this call returns without fetching
+        self._cancel_fetch()
 
-    def fetch_models(self) -> None:
-        """Start fetching models from current provider's API."""
         api_key = self.api_key_edit.text().strip()
         if not api_key:
             return
 
         provider = self.get_current_provider()
 
-        # Stop any existing worker
-        if self.model_fetch_worker and self.model_fetch_worker.isRunning():
-            self.model_fetch_worker.terminate()
-            self.model_fetch_worker.wait()
-
-        # Start new worker with current provider
-        self.model_fetch_worker = ModelFetchWorker(provider, api_key)
-        self.model_fetch_worker.models_fetched.connect(self.on_models_fetched)
-        self.model_fetch_worker.fetch_error.connect(self.on_model_fetch_error)
+        if not force:
+            cached, age = model_cache.load_models(provider.value, model_cache.hash_api_key(api_key))
+            if cached:
+                self.available_models = cached
+                self.update_model_combo()
+                if age < model_cache.MODEL_CACHE_TTL:
+                    logger.debug(f"Using cached {provider.value} models")
+                    return
 
         # Show loading state
         self.model_loading_label.setText("Loading models...")
         self.model_loading_label.show()
         self.refresh_models_btn.setEnabled(False)
 
-        self.model_fetch_worker.start()
+        self._fetch_task = asyncio.ensure_future(self._fetch_models_async(provider, api_key))
+        self._fetch_task.add_done_callback(self._on_fetch_done)
+
+    async def _fetch_models_async(self, provider: APIProvider, api_key: str) -> List[ModelInfo]:
+        """
+        Fetch models on the application's event loop and cache them.
+
+        Args:
+            provider: Provider to query
+            api_key: API key for the provider
+
+        Returns:
+            List[ModelInfo]: Available models
+        """
+        # Reuses the shared pool so repeat fetches skip the TLS handshake
+        models = await fetch_provider_models(provider.value, api_key, timeout=10)
+
+        # The fetchers return the built-in list on failure; don't cache that
+        if models != _fallback_models(provider):
+            await asyncio.to_thread(
+                model_cache.save_models, provider.value, model_cache.hash_api_key(api_key), models
+            )
+
+        return models
+
+    def _on_fetch_done(self, task: asyncio.Task) -> None:
+        """Show the outcome of a model fetch."""
+        # A fetch that finished just before being superseded still runs this
+        # callback; only the current fetch may update the model list
+        if task.cancelled() or task is not self._fetch_task:
+            return
+
+        error = task.exception()
+        if error is not None:
+            logger.error(f"Failed to fetch models: {error}")
+            self.on_model_fetch_error(str(error))
+        else:
+            self.on_models_fetched(task.result())
+
+    def _cancel_fetch(self) -> None:
+        """Cancel the running model fetch, if any, and clear its loading state."""
+        if self._fetch_task and not self._fetch_task.done():
+            self._fetch_task.cancel()
+            self.model_loading_label.hide()
+            self.refresh_models_btn.setEnabled(bool(self.api_key_edit.text().strip()))
+        self._fetch_task = None
+
+    def done(self, result: int) -> None:
+        """Stop background work when the dialog closes."""
+        self._cancel_fetch()
+        if self._test_task and not self._test_task.done():
+            self._test_task.cancel()
+        super().done(result)
 
     def refresh_models(self) -> None:
         """Refresh models manually."""
-        self.fetch_models()
+        self.fetch_models(force=True)
 
     def on_models_fetched(self, models: List[ModelInfo]) -> None:
         """Handle successful model fetching."""
@@ -782,14 +971,11 @@ class SettingsDialog(QDialog):
         has_key = bool(self.api_key_edit.text().strip())
         self.refresh_models_btn.setEnabled(has_key)
 
-        # Auto-refresh models if we have a valid-looking API key
+        # Restart the countdown; models are fetched once typing stops
+        self._key_debounce.start()
+
+    def _on_api_key_settled(self) -> None:
+        """Fetch models once the API key has stopped changing."""
         api_key = self.api_key_edit.text().strip()
         if len(api_key) > 20:  # Basic validation
-            # Delay fetching to avoid too many requests while typing
-            if hasattr(self, '_api_key_timer'):
-                self._api_key_timer.stop()
-
-            self._api_key_timer = QTimer()
-            self._api_key_timer.setSingleShot(True)
-            self._api_key_timer.timeout.connect(self.fetch_models)
-            self._api_key_timer.start(1000)  # Wait 1 second after typing stops
+            self.fetch_models()
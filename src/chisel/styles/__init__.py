@@ -1,5 +1,5 @@
 """Stylesheet management utilities for Chisel application."""
 
-from .loader import StylesheetLoader, apply_main_stylesheet
+from .loader import StylesheetLoader, apply_main_stylesheet, apply_application_stylesheet
 
-__all__ = ['StylesheetLoader', 'apply_main_stylesheet']
\ No newline at end of file
+__all__ = ['StylesheetLoader', 'apply_main_stylesheet', 'apply_application_stylesheet']
\ No newline at end of file
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Optional, Dict
 from loguru import logger
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtWidgets import QWidget, QApplication
 
 
 class StylesheetLoader:
@@ -170,4 +170,30 @@ def apply_main_stylesheet(widget: QWidget) -> bool:
         app.setFont(sfpro_font)
         logger.debug("Set application font to SF Pro")
 
-    return StylesheetLoader.apply_stylesheet(widget, "main.qss")
\ No newline at end of file
+    return StylesheetLoader.apply_stylesheet(widget, "main.qss")
+
+
+def apply_application_stylesheet(app: QApplication) -> bool:
+    """Apply the main stylesheet and font once to the whole application.
+
+    Widgets inherit the parsed style through their object-name selectors,
+    so dialogs no longer need to set (and re-parse) it on every open.
+
+    Args:
+        app: Application instance to style
+
+    Returns:
+        True if successful, False otherwise
+    """
+    from PyQt6.QtGui import QFont
+
+    app.setFont(QFont("SF Pro", 10))
+
+    stylesheet = StylesheetLoader.load_stylesheet("main.qss")
+    if not stylesheet:
+        logger.warning("No stylesheet content to apply for main.qss")
+        return False
+
+    app.setStyleSheet(stylesheet)
+    logger.debug("Applied main stylesheet to application")
+    return True
@@ -128,10 +128,10 @@ class SystemTrayIcon(QSystemTrayIcon):
 
     def show_about(self) -> None:
         """Show the About window."""
-        # Create window if it doesn't exist or has been closed
-        if self.about_window is None or not self.about_window.isVisible():
+        # Build the window on first use and reuse it for later opens
+        if self.about_window is None:
             self.about_window = AboutWindow()
-            logger.info("Created new About window instance")
+            logger.info("Created About window instance")
 
         # Show, raise, and activate
         self.about_window.show()